@@ -3,8 +3,17 @@ from typing import Optional
 from datetime import datetime, timezone
 from pathlib import Path
 import json
+import sys
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# slots=True needs Python 3.10; older interpreters keep regular instance dicts
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 class ShotStatus(str, Enum):
     PENDING = "pending"
     QUEUED = "queued"
@@ -23,7 +32,7 @@ class Profile:
     burst: int = 10
     backoff_seconds: float = 1.0
 
-@dataclass
+@dataclass(**_SLOTS)
 class Shot:
     id: str
     model: str
@@ -38,7 +47,7 @@ class Shot:
     meta: dict = field(default_factory=dict)
     created_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
 
-@dataclass
+@dataclass(**_SLOTS)
 class Template:
     id: str
     name: str
@@ -65,6 +74,8 @@ class Settings:
     parallel_jobs: int = 1
     default_profile: Optional[str] = None
 
+_DELTA_FIELDS = ("output_dir", "current_model", "current_size", "current_duration", "current_prompt")
+
 @dataclass
 class Project:
     name: str
@@ -118,23 +129,77 @@ class Project:
         path.parent.mkdir(parents=True, exist_ok=True)
         temp_path = path.with_suffix('.tmp')
         try:
-            with open(temp_path, "w", encoding="utf-8") as f:
-                json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+            if orjson:
+                temp_path.write_bytes(orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2))
+            else:
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
             if path.exists():
                 path.unlink()
             temp_path.rename(path)
+            delta_path = self.delta_path(path)
+            if delta_path.exists():
+                delta_path.unlink()
         except Exception:
             if temp_path.exists():
                 temp_path.unlink()
             raise
     
+    @staticmethod
+    def delta_path(path: Path) -> Path:
+        """Sidecar file holding incremental changes on top of the project file."""
+        return path.with_name(path.name + ".delta")
+    
+    def save_delta(self, path: Path, shots: list[Shot]) -> None:
+        """Append the current state and the given shots to the delta sidecar.
+        
+        A full save() compacts the sidecar back into the project file.
+        """
+        record = {field_name: getattr(self, field_name) for field_name in _DELTA_FIELDS}
+        record["modified_at"] = datetime.now(timezone.utc).isoformat()
+        record["shots"] = [asdict(s) for s in shots]
+        if orjson:
+            line = orjson.dumps(record) + b"\n"
+        else:
+            line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+        with open(self.delta_path(path), "ab") as f:
+            f.write(line)
+    
+    def _apply_delta(self, delta_path: Path) -> None:
+        index = {s.id: i for i, s in enumerate(self.shots)}
+        with open(delta_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break  # torn trailing write; keep what was applied so far
+                for field_name in _DELTA_FIELDS + ("modified_at",):
+                    if field_name in record:
+                        setattr(self, field_name, record[field_name])
+                for shot_data in record.get("shots", []):
+                    shot = Shot(**shot_data)
+                    if shot.id in index:
+                        self.shots[index[shot.id]] = shot
+                    else:
+                        index[shot.id] = len(self.shots)
+                        self.shots.append(shot)
+    
     @classmethod
     def load(cls, path: Path) -> "Project":
         """Load project from file."""
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return cls.from_dict(data)
+            if orjson:
+                data = orjson.loads(path.read_bytes())
+            else:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            project = cls.from_dict(data)
+            delta_path = cls.delta_path(path)
+            if delta_path.exists():
+                project._apply_delta(delta_path)
+            return project
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid project file format: {e}") from e
         except Exception as e:
@@ -1,17 +1,20 @@
 from dataclasses import dataclass
 from typing import Optional, Callable
-from threading import Thread, Lock, Event, Semaphore
-from queue import PriorityQueue, Empty
-import time
+from threading import Thread, Lock, Event, Semaphore, Condition
+from itertools import count
+import heapq
 import json
 import logging
+import time
 from pathlib import Path
 
-from sora_core.models import Shot, Profile
+from sora_core.models import _SLOTS, Shot, Profile
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+_seq = count()
+
+@dataclass(**_SLOTS)
 class QueueItem:
     priority: int
     shot: Shot
@@ -19,29 +22,36 @@ class QueueItem:
     cancel_event: Event = None
     progress: float = 0.0
     status_text: str = "Queued"
+    seq: int = -1
     
     def __post_init__(self):
         if self.cancel_event is None:
             self.cancel_event = Event()
+        if self.seq < 0:
+            self.seq = next(_seq)
     
     def __lt__(self, other):
-        return self.priority < other.priority
+        # seq keeps equal priorities in FIFO order
+        return (self.priority, self.seq) < (other.priority, other.seq)
 
 class QueueManager:
     def __init__(self, parallel_jobs: int = 1, state_file: Optional[Path] = None, worker_factory: Optional[Callable] = None):
         self.parallel_jobs = parallel_jobs
         self.state_file = state_file
         self._worker_factory = worker_factory
-        self._queue: PriorityQueue[QueueItem] = PriorityQueue()
+        self._heap: list[QueueItem] = []
         self._items: dict[str, QueueItem] = {}
         self._active: dict[str, QueueItem] = {}
         self._completed: list[str] = []
         self._failed: list[str] = []
         self._lock = Lock()
+        self._ready = Condition(self._lock)
         self._workers: list[Thread] = []
         self._running = False
+        # Bumped by stop() so threads left winding down don't rejoin a restarted queue
+        self._generation = 0
         self._semaphore = Semaphore(parallel_jobs)
-        self._on_status_change: Optional[Callable] = None
+        self._status_listeners: list[Callable] = []
         
         if state_file and state_file.exists():
             self._load_state()
@@ -72,28 +82,43 @@ class QueueManager:
                 cancel_event=Event()
             )
             self._items[shot.id] = item
-            self._queue.put(item)
+            heapq.heappush(self._heap, item)
+            self._ready.notify()
             self._save_state()
             
-            if self._on_status_change:
-                self._on_status_change(shot.id, "queued")
+            self._notify_status(shot.id, "queued")
             
             logger.info(f"Enqueued shot: {shot.id}")
     
     def reorder(self, shot_ids: list[str]) -> None:
         with self._lock:
-            new_queue: PriorityQueue[QueueItem] = PriorityQueue()
+            new_heap: list[QueueItem] = []
             
             for priority, shot_id in enumerate(shot_ids):
                 if shot_id in self._items and shot_id not in self._active:
                     item = self._items[shot_id]
                     item.priority = priority
-                    new_queue.put(item)
+                    new_heap.append(item)
             
-            self._queue = new_queue
+            heapq.heapify(new_heap)
+            self._heap = new_heap
+            self._ready.notify_all()
             self._save_state()
             logger.info(f"Reordered queue: {len(shot_ids)} items")
     
+    def swap(self, shot_id_a: str, shot_id_b: str) -> bool:
+        """Exchange the queue positions of two items."""
+        with self._lock:
+            a = self._items.get(shot_id_a)
+            b = self._items.get(shot_id_b)
+            if not a or not b:
+                return False
+            a.priority, b.priority = b.priority, a.priority
+            a.seq, b.seq = b.seq, a.seq
+            heapq.heapify(self._heap)
+            self._save_state()
+            return True
+    
     def cancel(self, shot_id: str) -> bool:
         with self._lock:
             if shot_id in self._items:
@@ -101,8 +126,7 @@ class QueueManager:
                 item.cancel_event.set()
                 item.shot.status = "cancelled"
                 
-                if self._on_status_change:
-                    self._on_status_change(shot_id, "cancelled")
+                self._notify_status(shot_id, "cancelled")
                 
                 self._save_state()
                 logger.info(f"Cancelled shot: {shot_id}")
@@ -113,10 +137,11 @@ class QueueManager:
     def get_all_items(self) -> list[tuple[str, Shot, int, str]]:
         with self._lock:
             items = []
-            for shot_id, item in self._items.items():
+            for item in sorted(self._items.values()):
+                shot_id = item.shot.id
                 status = "active" if shot_id in self._active else item.shot.status
                 items.append((shot_id, item.shot, item.priority, status))
-            return sorted(items, key=lambda x: x[2])
+            return items
     
     def get_queue_status(self) -> dict:
         with self._lock:
@@ -130,16 +155,20 @@ class QueueManager:
                 "total": len(self._items)
             }
     
-    def set_status_callback(self, callback: Callable) -> None:
-        self._on_status_change = callback
+    def add_status_listener(self, callback: Callable) -> None:
+        """Register callback(shot_id, status); it runs on whichever thread changed the status"""
+        self._status_listeners.append(callback)
+    
+    def _notify_status(self, shot_id: str, status: str) -> None:
+        for callback in self._status_listeners:
+            callback(shot_id, status)
     
     def update_status(self, shot_id: str, status: str, progress: float = 0.0) -> None:
         with self._lock:
             if shot_id in self._items:
                 self._items[shot_id].shot.status = status
                 self._items[shot_id].progress = progress
-                if self._on_status_change:
-                    self._on_status_change(shot_id, status)
+                self._notify_status(shot_id, status)
                 self._save_state()
     
     def start(self) -> None:
@@ -148,30 +177,32 @@ class QueueManager:
         
         self._running = True
         for i in range(self.parallel_jobs):
-            worker = Thread(target=self._worker_loop, daemon=True, name=f"QueueWorker-{i}")
+            worker = Thread(target=self._worker_loop, args=(self._generation,), daemon=True, name=f"QueueWorker-{i}")
             worker.start()
             self._workers.append(worker)
         logger.info(f"Started queue manager with {self.parallel_jobs} workers")
     
-    def stop(self) -> None:
-        self._running = False
-        for worker in self._workers:
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stop the worker threads, waiting at most timeout seconds for all of them together"""
+        with self._ready:
+            self._running = False
+            self._generation += 1
+            self._ready.notify_all()
+            workers, self._workers = self._workers, []
+        deadline = time.monotonic() + timeout
+        for worker in workers:
             if worker.is_alive():
-                worker.join(timeout=2.0)
-        self._workers.clear()
+                worker.join(timeout=max(0.0, deadline - time.monotonic()))
         logger.info("Stopped queue manager")
     
-    def _worker_loop(self) -> None:
-        while self._running:
-            item = None
-            
-            try:
-                item = self._queue.get(timeout=0.5)
-            except Empty:
-                continue
-            
-            if not item:
-                continue
+    def _worker_loop(self, generation: int) -> None:
+        while True:
+            with self._ready:
+                while self._running and self._generation == generation and not self._heap:
+                    self._ready.wait()
+                if not self._running or self._generation != generation:
+                    break
+                item = heapq.heappop(self._heap)
             
             self._semaphore.acquire()
             
@@ -179,11 +210,10 @@ class QueueManager:
                 with self._lock:
                     self._active[item.shot.id] = item
                     item.shot.status = "processing"
-                    if self._on_status_change:
-                        self._on_status_change(item.shot.id, "processing")
+                    self._notify_status(item.shot.id, "processing")
                 
                 if item.profile:
-                    self._apply_rate_limit(item.profile)
+                    self._apply_rate_limit(item.profile, item.cancel_event)
                 
                 if item.cancel_event.is_set():
                     raise Exception("Cancelled")
@@ -201,8 +231,7 @@ class QueueManager:
                     if item.shot.id in self._active:
                         del self._active[item.shot.id]
                     self._completed.append(item.shot.id)
-                    if self._on_status_change:
-                        self._on_status_change(item.shot.id, "completed")
+                    self._notify_status(item.shot.id, "completed")
                 
                 logger.info(f"Completed shot: {item.shot.id}")
                 
@@ -213,8 +242,7 @@ class QueueManager:
                         del self._active[item.shot.id]
                     self._failed.append(item.shot.id)
                     item.shot.status = "failed"
-                    if self._on_status_change:
-                        self._on_status_change(item.shot.id, "failed")
+                    self._notify_status(item.shot.id, "failed")
             finally:
                 self._semaphore.release()
                 self._save_state()
@@ -230,9 +258,10 @@ class QueueManager:
             self._save_state()
             logger.info(f"Cleared {len(to_remove)} completed items")
     
-    def _apply_rate_limit(self, profile: Profile) -> None:
+    def _apply_rate_limit(self, profile: Profile, cancel_event: Event) -> None:
+        # Waiting on the item's event lets a cancel cut the backoff short
         if profile.backoff_seconds > 0:
-            time.sleep(profile.backoff_seconds)
+            cancel_event.wait(profile.backoff_seconds)
     
     def _save_state(self) -> None:
         if not self.state_file:
@@ -259,7 +288,7 @@ class QueueManager:
                             "created_at": item.shot.created_at
                         }
                     }
-                    for item in sorted(self._items.values(), key=lambda x: x.priority)
+                    for item in sorted(self._items.values())
                 ],
                 "completed": self._completed,
                 "failed": self._failed
@@ -295,7 +324,7 @@ class QueueManager:
                     cancel_event=Event()
                 )
                 self._items[shot.id] = item
-                self._queue.put(item)
+                heapq.heappush(self._heap, item)
             
             logger.info(f"Loaded {len(self._items)} items from queue state")
         except Exception as e:
@@ -1,6 +1,8 @@
+from functools import lru_cache
 from importlib.resources import files, as_file
 from PySide6.QtGui import QIcon
 
+@lru_cache(maxsize=64)
 def icon(name: str) -> QIcon:
     res = files("sora_gui.assets.icons").joinpath(name)
     with as_file(res) as p:
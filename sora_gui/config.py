@@ -2,6 +2,8 @@
 import json
 import base64
 import logging
+import os
+import threading
 from pathlib import Path
 from typing import Dict, Any, Optional
 
@@ -33,6 +35,9 @@ CONFIG_DIR = get_config_dir()
 CONFIG_FILE = CONFIG_DIR / "config.json"
 OUTPUT_DIR = get_output_dir()
 
+# Serializes read-modify-write of the config file; templates are saved from a worker thread
+_config_lock = threading.RLock()
+
 def ensure_dirs() -> None:
     """Ensure config and output directories exist"""
     try:
@@ -46,7 +51,9 @@ def load_config() -> Dict[str, Any]:
     if not CONFIG_FILE.exists():
         return {}
     try:
-        return json.loads(CONFIG_FILE.read_text(encoding="utf-8"))
+        with _config_lock:
+            text = CONFIG_FILE.read_text(encoding="utf-8")
+        return json.loads(text)
     except Exception as e:
         logger.error(f"Failed to load config: {e}")
         return {}
@@ -55,10 +62,22 @@ def save_config(data: Dict[str, Any]) -> None:
     """Save configuration to file"""
     try:
         ensure_dirs()
-        CONFIG_FILE.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        text = json.dumps(data, ensure_ascii=False, indent=2)
+        # Write beside the real file and swap it in so no reader ever sees a partial file
+        tmp = CONFIG_FILE.with_suffix(".json.tmp")
+        with _config_lock:
+            tmp.write_text(text, encoding="utf-8")
+            os.replace(tmp, CONFIG_FILE)
     except Exception as e:
         logger.error(f"Failed to save config: {e}")
 
+def _set_config_value(key: str, value: Any) -> None:
+    """Replace one top-level config entry"""
+    with _config_lock:
+        cfg = load_config()
+        cfg[key] = value
+        save_config(cfg)
+
 def get_saved_key() -> str:
     """Retrieve saved API key from keyring or config file"""
     if keyring:
@@ -84,18 +103,17 @@ def set_saved_key(key: str) -> None:
     if keyring:
         try:
             keyring.set_password(SERVICE_NAME, "OPENAI_API_KEY", key)
-            cfg = load_config()
-            if "api_key" in cfg:
-                del cfg["api_key"]
-            save_config(cfg)
+            with _config_lock:
+                cfg = load_config()
+                if "api_key" in cfg:
+                    del cfg["api_key"]
+                save_config(cfg)
             return
         except Exception as e:
             logger.warning(f"Keyring save failed, using config file: {e}")
     
     encoded = base64.b64encode(key.encode()).decode()
-    cfg = load_config()
-    cfg["api_key"] = encoded
-    save_config(cfg)
+    _set_config_value("api_key", encoded)
 
 def get_settings() -> Dict[str, Any]:
     """Get settings from config"""
@@ -104,9 +122,7 @@ def get_settings() -> Dict[str, Any]:
 
 def save_settings(settings: Dict[str, Any]) -> None:
     """Save settings to config"""
-    cfg = load_config()
-    cfg["settings"] = settings
-    save_config(cfg)
+    _set_config_value("settings", settings)
 
 def get_recent_projects() -> list[str]:
     """Get list of recent project paths"""
@@ -115,13 +131,14 @@ def get_recent_projects() -> list[str]:
 
 def add_recent_project(path: str) -> None:
     """Add project to recent list"""
-    cfg = load_config()
-    recent = cfg.get("recent_projects", [])
-    if path in recent:
-        recent.remove(path)
-    recent.insert(0, path)
-    cfg["recent_projects"] = recent[:10]
-    save_config(cfg)
+    with _config_lock:
+        cfg = load_config()
+        recent = cfg.get("recent_projects", [])
+        if path in recent:
+            recent.remove(path)
+        recent.insert(0, path)
+        cfg["recent_projects"] = recent[:10]
+        save_config(cfg)
 
 def get_last_state() -> Dict[str, Any]:
     """Get last application state"""
@@ -130,9 +147,7 @@ def get_last_state() -> Dict[str, Any]:
 
 def save_last_state(state: Dict[str, Any]) -> None:
     """Save last application state"""
-    cfg = load_config()
-    cfg["last_state"] = state
-    save_config(cfg)
+    _set_config_value("last_state", state)
 
 def get_window_geometry() -> Dict[str, Any]:
     """Get window geometry"""
@@ -141,9 +156,7 @@ def get_window_geometry() -> Dict[str, Any]:
 
 def save_window_geometry(geometry: Dict[str, Any]) -> None:
     """Save window geometry"""
-    cfg = load_config()
-    cfg["window_geometry"] = geometry
-    save_config(cfg)
+    _set_config_value("window_geometry", geometry)
 
 def get_templates() -> list:
     """Get global templates from config"""
@@ -152,6 +165,4 @@ def get_templates() -> list:
 
 def save_templates(templates: list) -> None:
     """Save global templates to config"""
-    cfg = load_config()
-    cfg["templates"] = templates
-    save_config(cfg)
+    _set_config_value("templates", templates)
@@ -1,4 +1,5 @@
 """Application constants and configuration"""
+import os
 from enum import Enum
 
 API_BASE = "https://api.openai.com/v1"
@@ -9,9 +10,23 @@ SUPPORTED_SIZES = {
     "sora-2-pro": ["1280x720", "720x1280", "1024x1792", "1792x1024"]
 }
 
+# (width, height) for every size offered above
+SIZE_INFO = {s: tuple(map(int, s.split("x"))) for sizes in SUPPORTED_SIZES.values() for s in sizes}
+
 SUPPORTED_SECONDS = ["4", "8", "12"]
 
-DOWNLOAD_CHUNK_SIZE = 262144
+# Video downloads are tens to hundreds of MB; SORA_DOWNLOAD_CHUNK_SIZE (bytes) overrides
+try:
+    DOWNLOAD_CHUNK_SIZE = max(int(os.environ.get("SORA_DOWNLOAD_CHUNK_SIZE", "")), 1)
+except ValueError:
+    DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# Large downloads are split into this many concurrent HTTP Range requests
+DOWNLOAD_PARTS = 4
+PARALLEL_DOWNLOAD_MIN_SIZE = 16 * 1024 * 1024
+# Downloaded chunks are gathered into one write call per this many bytes
+WRITE_BATCH_SIZE = 4 * 1024 * 1024
+# Error bodies beyond this are cut before parsing so a runaway server dump stays small
+MAX_ERROR_BODY_SIZE = 256 * 1024
 TIMEOUT_POST = 300
 TIMEOUT_GET = 120
 TIMEOUT_DOWNLOAD = 600
@@ -20,6 +35,8 @@ TIMEOUT_MODERATION = 60
 MAX_BACKOFF = 15
 BACKOFF_MULTIPLIER = 1.5
 STUCK_CHECK_INTERVAL = 10
+MAX_POLL_INTERVAL = 30
+POLL_RATE_ALPHA = 0.9
 PREVIEW_MAX_SIZE = 360
 MIN_DISK_SPACE_GB = 5.0
 MIN_API_KEY_LENGTH = 20
@@ -1,42 +1,76 @@
 """Main application window"""
 import os
+import json
 import logging
+import threading
+import time
+from contextlib import ExitStack
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple
 
-import requests
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QFormLayout, QHBoxLayout, QGridLayout,
-    QComboBox, QLineEdit, QTextEdit, QPushButton, QLabel, QFileDialog,
+    QComboBox, QLineEdit, QPushButton, QLabel, QFileDialog,
     QProgressBar, QPlainTextEdit, QMessageBox, QSplitter, QCheckBox, QSpinBox, QFrame, QSizePolicy, QScrollArea,
     QTabWidget, QMenu
 )
-from PySide6.QtCore import Qt, QTimer, QThread, QSize, QUrl, QMetaObject, Q_ARG, QPoint, QRect
+from PySide6.QtCore import Qt, QTimer, QThread, QSize, QUrl, QMetaObject, Q_ARG, QPoint, QRect, Signal, QSignalBlocker, QFileSystemWatcher, QThreadPool, QByteArray
 from PySide6.QtGui import QDesktopServices, QGuiApplication
+from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
 from shiboken6 import isValid
 
-try:
-    from PIL import Image
-except ImportError:
-    Image = None
-
-from .constants import API_BASE, SUPPORTED_SIZES, SUPPORTED_SECONDS, TIMEOUT_TEST, TIMEOUT_MODERATION
-from .config import OUTPUT_DIR, get_saved_key, set_saved_key, ensure_dirs, load_config, save_config
-from .utils import safe_json, pretty, aspect_of, check_disk_space, validate_api_key
+from .constants import (
+    API_BASE, SUPPORTED_SIZES, SUPPORTED_SECONDS, SIZE_INFO, TIMEOUT_TEST, TIMEOUT_MODERATION, DOWNLOAD_PARTS
+)
+from .config import OUTPUT_DIR, get_saved_key, set_saved_key, ensure_dirs, load_config, _set_config_value
+from .utils import safe_json_bytes, pretty, parse_size, check_disk_space, validate_api_key
 from sora_gui.preview import CompactPreviewRow
 from .dialogs import JsonDialog
-from .worker import Worker
+from .worker import Worker, ShotRunnable
 from .assets import icon
 from sora_core.models import Project, Settings, Shot, Template
 from sora_core.queue import QueueManager
 from .config import get_settings, save_settings, get_last_state, save_last_state, get_recent_projects, add_recent_project, CONFIG_DIR, get_window_geometry, save_window_geometry
 from .queue_panel import QueuePanel
 from .template_panel import TemplatePanel
-import uuid
 
 logger = logging.getLogger(__name__)
 
+_disk_cache: dict[str, tuple[float, bool]] = {}
+
+@lru_cache(maxsize=None)
+def _pil_image():
+    """Import PIL.Image on first use; None when Pillow is not installed"""
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+    return Image
+
+def _check_disk_cached(path: str, ttl: float = 5.0) -> bool:
+    """check_disk_space, reusing the result for the same path within ttl seconds"""
+    now = time.monotonic()
+    cached = _disk_cache.get(path)
+    if cached and now - cached[0] < ttl:
+        return cached[1]
+    ok = check_disk_space(path)
+    _disk_cache[path] = (now, ok)
+    return ok
+
+class ShotResult:
+    """Outcome of one queued shot, filled in by the Worker callbacks"""
+    __slots__ = ("success", "error")
+
+    def __init__(self, success: bool = False, error: Optional[str] = None):
+        self.success = success
+        self.error = error
+
 class SoraApp(QMainWindow):
+    moderationReady = Signal(bool, list)
+    # Emitted from queue threads when a shot's fields change; delivered on the GUI thread
+    shotChanged = Signal(str)
+    
     def __init__(self):
         super().__init__()
         self.setObjectName("Root")
@@ -55,6 +89,47 @@ class SoraApp(QMainWindow):
         self.template_panel: Optional[TemplatePanel] = None
         self.queue_running: bool = False
         self.prompt_history: list[str] = []
+        self._last_state_written: Optional[dict] = None
+        self._nam = QNetworkAccessManager(self)
+        self.shot_pool = QThreadPool(self)
+        self.shot_pool.setMaxThreadCount(min(4, QThread.idealThreadCount()))
+        # Created on first use so startup doesn't pay for importing requests
+        self._http = None
+        self._http_lock = threading.Lock()
+        self._pending_prompt: Optional[str] = None
+        self._moderation_reply: Optional[QNetworkReply] = None
+        self._last_failure_sig: Optional[tuple] = None
+        self._last_sizes_model: Optional[str] = None
+        self._recent_valid: dict[str, bool] = {}
+        self._ref_dim_cache: dict[str, tuple[int, int, tuple[int, int]]] = {}
+        self._dirty_shots: dict[str, Shot] = {}
+        # Workers running on shot_pool, so shutdown can cancel them
+        self._shot_workers: set[Worker] = set()
+        self._shot_workers_lock = threading.Lock()
+        self._delta_records: int = 0
+        self._ensured_dirs: set[str] = set()
+        self._recent_watcher = QFileSystemWatcher(self)
+        self._recent_watcher.directoryChanged.connect(self._on_recent_dir_changed)
+        self._history_dirty: bool = False
+        
+        self._layout_check_timer = QTimer(self)
+        self._layout_check_timer.setSingleShot(True)
+        self._layout_check_timer.setInterval(80)
+        self._layout_check_timer.timeout.connect(self._layout_self_check_now)
+        
+        self._history_flush_timer = QTimer(self)
+        self._history_flush_timer.setSingleShot(True)
+        self._history_flush_timer.setInterval(2000)
+        self._history_flush_timer.timeout.connect(self._flush_prompt_history)
+        
+        self._prompt_debounce = QTimer(self)
+        self._prompt_debounce.setSingleShot(True)
+        self._prompt_debounce.setInterval(250)
+        self._prompt_debounce.timeout.connect(self._mark_modified)
+        self._modify_timer = QTimer(self)
+        self._modify_timer.setSingleShot(True)
+        self._modify_timer.setInterval(100)
+        self._modify_timer.timeout.connect(self._apply_modified)
         
         ensure_dirs()
         self._setup_ui()
@@ -73,24 +148,35 @@ class SoraApp(QMainWindow):
             self._update_window_title()
     
     def _restore_geometry(self) -> None:
-        """Restore window geometry"""
+        """Restore window geometry; updates stay off until the event loop runs"""
+        self.setUpdatesEnabled(False)
         geometry = get_window_geometry()
         if geometry:
+            if geometry.get("encoding") == "base64":
+                decode = lambda text: QByteArray.fromBase64(text.encode("ascii"))
+            else:
+                decode = bytes.fromhex  # written by older versions
             if "window_geometry" in geometry:
                 try:
-                    self.restoreGeometry(bytes.fromhex(geometry["window_geometry"]))
+                    self.restoreGeometry(decode(geometry["window_geometry"]))
                 except Exception as e:
                     logger.warning(f"Failed to restore window geometry: {e}")
             if "splitter_state" in geometry:
                 try:
-                    self.centralWidget().restoreState(bytes.fromhex(geometry["splitter_state"]))
+                    self.centralWidget().restoreState(decode(geometry["splitter_state"]))
                 except Exception as e:
                     logger.warning(f"Failed to restore splitter state: {e}")
             if "left_splitter_sizes" in geometry and geometry["left_splitter_sizes"]:
                 try:
-                    QTimer.singleShot(100, lambda: self._restore_left_splitter(geometry["left_splitter_sizes"]))
+                    self._restore_left_splitter(geometry["left_splitter_sizes"])
                 except Exception as e:
                     logger.warning(f"Failed to restore left splitter: {e}")
+        QTimer.singleShot(0, self._finish_restore)
+    
+    def _finish_restore(self) -> None:
+        """Re-enable painting after startup restore and run one layout check"""
+        self.setUpdatesEnabled(True)
+        self._layout_check_timer.start()
     
     def _restore_left_splitter(self, sizes) -> None:
         """Restore left splitter sizes"""
@@ -102,11 +188,17 @@ class SoraApp(QMainWindow):
     
     def _setup_ui(self) -> None:
         """Setup the user interface"""
+        self.setUpdatesEnabled(False)
+        parallel_jobs = max(1, Settings(**get_settings()).parallel_jobs)
         self.queue_manager = QueueManager(
-            parallel_jobs=1,
+            parallel_jobs=parallel_jobs,
             state_file=CONFIG_DIR / "queue_state.json",
             worker_factory=self._process_queue_shot
         )
+        # A restored queue state carries its own parallel_jobs; the settings value wins
+        self.queue_manager.set_parallel(parallel_jobs)
+        self.shotChanged.connect(self._mark_shot_dirty)
+        self.queue_manager.add_status_listener(lambda shot_id, _status: self.shotChanged.emit(shot_id))
         
         main_splitter = QSplitter(Qt.Orientation.Horizontal)
         
@@ -132,40 +224,73 @@ class SoraApp(QMainWindow):
         self.setCentralWidget(main_splitter)
     
     def _create_right_tabs(self) -> QTabWidget:
-        tabs = QTabWidget()
+        """Create right-hand tabs; panels are built the first time their tab is shown"""
+        self.right_tabs = QTabWidget()
+        self.right_tabs.addTab(QWidget(), "Queue")
+        self.right_tabs.addTab(QWidget(), "Templates")
+        self._tab_factories = {0: self._build_queue_panel, 1: self._build_template_panel}
+        
+        self._ensure_tab_built(self.right_tabs.currentIndex())
+        self.right_tabs.currentChanged.connect(self._ensure_tab_built)
         
+        return self.right_tabs
+    
+    def _ensure_tab_built(self, index: int) -> None:
+        """Swap the placeholder at index for its real panel on first visit"""
+        factory = self._tab_factories.pop(index, None)
+        if factory is None:
+            return
+        
+        tabs = self.right_tabs
+        title = tabs.tabText(index)
+        placeholder = tabs.widget(index)
+        with QSignalBlocker(tabs):
+            tabs.removeTab(index)
+            tabs.insertTab(index, factory(), title)
+            tabs.setCurrentIndex(index)
+        placeholder.deleteLater()
+    
+    def _build_queue_panel(self) -> QueuePanel:
         self.queue_panel = QueuePanel(self)
         self.queue_panel.set_queue_manager(self.queue_manager)
-        tabs.addTab(self.queue_panel, "Queue")
-        
+        return self.queue_panel
+    
+    def _build_template_panel(self) -> TemplatePanel:
         self.template_panel = TemplatePanel(self)
         self.template_panel.main_window = self
         self.template_panel.template_applied.connect(self._on_template_prompt_applied)
-        tabs.addTab(self.template_panel, "Templates")
-        
-        return tabs
+        return self.template_panel
     
     def _on_template_prompt_applied(self, prompt: str):
-        self.prompt_edit.setPlainText(prompt)
+        with QSignalBlocker(self.prompt_edit):
+            self.prompt_edit.setPlainText(prompt)
         self._mark_modified()
     
     def apply_template(self, template: Template):
-        idx = self.model_box.findText(template.model)
-        if idx >= 0:
-            self.model_box.setCurrentIndex(idx)
-        
-        size_str = f"{template.width}x{template.height}"
-        idx = self.size_box.findText(size_str)
-        if idx >= 0:
-            self.size_box.setCurrentIndex(idx)
-        
-        idx = self.seconds_box.findText(str(template.duration_s))
-        if idx >= 0:
-            self.seconds_box.setCurrentIndex(idx)
+        with ExitStack() as stack:
+            for w in (self.model_box, self.size_box, self.seconds_box, self.prompt_edit):
+                stack.enter_context(QSignalBlocker(w))
+            
+            idx = self.model_box.findText(template.model)
+            if idx >= 0:
+                self.model_box.setCurrentIndex(idx)
+                self.refresh_sizes()
+            
+            size_str = f"{template.width}x{template.height}"
+            idx = self.size_box.findText(size_str)
+            if idx >= 0:
+                self.size_box.setCurrentIndex(idx)
+            
+            idx = self.seconds_box.findText(str(template.duration_s))
+            if idx >= 0:
+                self.seconds_box.setCurrentIndex(idx)
+            
+            self.prompt_edit.setPlainText(template.prompt)
         
-        self.prompt_edit.setPlainText(template.prompt)
+        self.on_size_change(self.size_box.currentText())
+        self._layout_check_timer.start()
         self._mark_modified()
-        self.log.appendPlainText(f"Applied template: {template.name}")
+        self.log_line(f"Applied template: {template.name}")
     
     def _setup_menu(self) -> None:
         """Setup menu bar"""
@@ -182,7 +307,7 @@ class SoraApp(QMainWindow):
         open_action.triggered.connect(self.open_project)
         
         self.recent_menu = file_menu.addMenu("Open &Recent")
-        self._update_recent_menu()
+        self.recent_menu.aboutToShow.connect(self._update_recent_menu)
         
         file_menu.addSeparator()
         
@@ -211,15 +336,35 @@ class SoraApp(QMainWindow):
             return
         
         for project_path in recent:
-            if Path(project_path).exists():
+            if self._recent_exists(project_path):
                 action = self.recent_menu.addAction(Path(project_path).name)
                 action.triggered.connect(lambda checked, p=project_path: self.open_project_path(p))
     
+    def _recent_exists(self, project_path: str) -> bool:
+        """Check a recent project path, using the watcher-backed cache when possible"""
+        valid = self._recent_valid.get(project_path)
+        if valid is None:
+            path = Path(project_path)
+            valid = path.exists()
+            self._recent_valid[project_path] = valid
+            parent = str(path.parent)
+            if path.parent.is_dir() and parent not in self._recent_watcher.directories():
+                self._recent_watcher.addPath(parent)
+        return valid
+    
+    def _on_recent_dir_changed(self, directory: str) -> None:
+        """Invalidate cached recent-project entries inside a changed directory"""
+        changed = Path(directory)
+        for project_path in list(self._recent_valid):
+            if Path(project_path).parent == changed:
+                del self._recent_valid[project_path]
+    
     def _setup_autosave(self) -> None:
-        """Setup autosave timer"""
+        """Setup autosave timer; it is (re)started by _mark_modified"""
         self.autosave_timer = QTimer(self)
+        self.autosave_timer.setSingleShot(True)
+        self.autosave_timer.setInterval(30000)
         self.autosave_timer.timeout.connect(self._autosave)
-        self.autosave_timer.start(30000)
     
     def _create_top_panel(self) -> QWidget:
         """Create top control panel"""
@@ -277,7 +422,8 @@ class SoraApp(QMainWindow):
         
         root.addLayout(prompt_header)
         
-        self.prompt_edit = QTextEdit()
+        self.prompt_edit = QPlainTextEdit()
+        self.prompt_edit.setTabChangesFocus(True)
         self.prompt_edit.setPlaceholderText("Insert your prompt here...")
         self.prompt_edit.setMinimumHeight(140)
         self.prompt_edit.setMaximumHeight(220)
@@ -413,6 +559,13 @@ class SoraApp(QMainWindow):
         self.log = QPlainTextEdit()
         self.log.setReadOnly(True)
         self.log.setMinimumHeight(10)
+        self.log.setMaximumBlockCount(2000)
+        
+        self._log_buffer: list[str] = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(100)
+        self._log_timer.timeout.connect(self._flush_log)
         
         bottom = QFrame()
         bottom.setProperty("card", True)
@@ -423,11 +576,23 @@ class SoraApp(QMainWindow):
         bottom_layout.addWidget(self.log, 1)
         return bottom
     
+    def log_line(self, text: str) -> None:
+        """Queue a line for the log view; lines are flushed in batches"""
+        self._log_buffer.append(text)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+    
+    def _flush_log(self) -> None:
+        """Append all buffered log lines in one call"""
+        if self._log_buffer:
+            self.log.appendPlainText("\n".join(self._log_buffer))
+            self._log_buffer.clear()
+    
     def _connect_signals(self) -> None:
         """Connect all signal handlers"""
         self.model_box.currentTextChanged.connect(self.refresh_sizes)
         self.size_box.currentTextChanged.connect(self.on_size_change)
-        self.size_box.currentTextChanged.connect(lambda: QTimer.singleShot(50, self._layout_self_check_now))
+        self.size_box.currentTextChanged.connect(lambda: self._layout_check_timer.start())
         self.input_browse.clicked.connect(self.browse_input)
         self.output_dir_btn.clicked.connect(self.browse_output)
         self.save_key_btn.clicked.connect(self.save_key)
@@ -438,6 +603,7 @@ class SoraApp(QMainWindow):
         self.open_last_btn.clicked.connect(self.open_last_file)
         self.resume_btn.clicked.connect(self.resume_job)
         self.copy_job_btn.clicked.connect(self.copy_job_id)
+        self.moderationReady.connect(self._on_moderation_ready)
     
     def _show_history_menu(self):
         menu = QMenu(self)
@@ -478,9 +644,16 @@ class SoraApp(QMainWindow):
         self._save_prompt_history()
     
     def _save_prompt_history(self):
-        cfg = load_config()
-        cfg["prompt_history"] = self.prompt_history
-        save_config(cfg)
+        self._history_dirty = True
+        self._history_flush_timer.start()
+    
+    def _flush_prompt_history(self):
+        """Write prompt history to config if it changed since the last flush"""
+        self._history_flush_timer.stop()
+        if not self._history_dirty:
+            return
+        _set_config_value("prompt_history", self.prompt_history)
+        self._history_dirty = False
     
     def _load_prompt_history(self):
         cfg = load_config()
@@ -493,51 +666,52 @@ class SoraApp(QMainWindow):
         self._load_prompt_history()
         
         last_state = get_last_state()
+        self._last_state_written = last_state or None
         if last_state:
-            if "model" in last_state:
-                idx = self.model_box.findText(last_state["model"])
-                if idx >= 0:
-                    self.model_box.setCurrentIndex(idx)
-            if "size" in last_state:
-                idx = self.size_box.findText(last_state["size"])
-                if idx >= 0:
-                    self.size_box.setCurrentIndex(idx)
-            if "duration" in last_state:
-                idx = self.seconds_box.findText(last_state["duration"])
-                if idx >= 0:
-                    self.seconds_box.setCurrentIndex(idx)
-            if "prompt" in last_state and last_state["prompt"]:
-                self.prompt_edit.setPlainText(last_state["prompt"])
+            with ExitStack() as stack:
+                for w in (self.model_box, self.size_box, self.seconds_box, self.prompt_edit):
+                    stack.enter_context(QSignalBlocker(w))
+                self._apply_last_state(last_state)
         
         self.on_size_change(self.size_box.currentText())
         
-        self.model_box.currentTextChanged.connect(lambda: self._mark_modified())
-        self.size_box.currentTextChanged.connect(lambda: self._mark_modified())
-        self.seconds_box.currentTextChanged.connect(lambda: self._mark_modified())
-        self.prompt_edit.textChanged.connect(lambda: self._mark_modified())
-        self.output_dir_edit.textChanged.connect(lambda: self._mark_modified())
+        self.model_box.currentTextChanged.connect(self._mark_modified)
+        self.size_box.currentTextChanged.connect(self._mark_modified)
+        self.seconds_box.currentTextChanged.connect(self._mark_modified)
+        self.prompt_edit.textChanged.connect(self._prompt_debounce.start)
+        self.output_dir_edit.textChanged.connect(lambda: self._prompt_debounce.start())
         
         QTimer.singleShot(500, self._layout_self_check_now)
     
+    def _apply_last_state(self, last_state: dict) -> None:
+        """Apply saved widget values; callers block signals around this"""
+        if "model" in last_state:
+            idx = self.model_box.findText(last_state["model"])
+            if idx >= 0:
+                self.model_box.setCurrentIndex(idx)
+                self.refresh_sizes()
+        if "size" in last_state:
+            idx = self.size_box.findText(last_state["size"])
+            if idx >= 0:
+                self.size_box.setCurrentIndex(idx)
+        if "duration" in last_state:
+            idx = self.seconds_box.findText(last_state["duration"])
+            if idx >= 0:
+                self.seconds_box.setCurrentIndex(idx)
+        if "prompt" in last_state and last_state["prompt"]:
+            self.prompt_edit.setPlainText(last_state["prompt"])
+    
     def resizeEvent(self, e) -> None:
         """Handle window resize"""
         super().resizeEvent(e)
-        QTimer.singleShot(50, self._layout_self_check_now)
+        self._layout_check_timer.start()
     
     def _global_rect(self, w):
         """Get widget rect relative to main window"""
-        if not w or not isValid(w):
+        if not w or not isValid(w) or not w.isVisible():
             return QRect()
         try:
-            if not w.isVisible():
-                return QRect()
-            geom = w.geometry()
-            parent = w.parent()
-            while parent and parent != self and isValid(parent):
-                parent_geom = parent.geometry()
-                geom.translate(parent_geom.x(), parent_geom.y())
-                parent = parent.parent()
-            return geom
+            return QRect(w.mapTo(self, QPoint(0, 0)), w.size())
         except Exception:
             return QRect()
     
@@ -560,27 +734,34 @@ class SoraApp(QMainWindow):
             if card.isEmpty() or pr.isEmpty() or prompt.isEmpty():
                 return
             
-            overlap = card.bottom() + 8 > prompt.top()
-            too_small = card.height() > 220
+            card_bottom = card.bottom()
+            card_h = card.height()
+            prompt_top = prompt.top()
+            overlap = card_bottom + 8 > prompt_top
+            too_small = card_h > 220
             
             if overlap or too_small:
                 if not hasattr(self, "_error_banner"):
-                    self._error_banner = QLabel(f"Layout error: preview overlapping or too large (card_bottom={card.bottom()}, prompt_top={prompt.top()}, card_h={card.height()})")
+                    self._error_banner = QLabel(f"Layout error: preview overlapping or too large (card_bottom={card_bottom}, prompt_top={prompt_top}, card_h={card_h})")
                     self._error_banner.setStyleSheet("background:#EF4444;color:white;padding:6px 10px;border-radius:8px;font-weight:600;")
                     self.statusBar().addPermanentWidget(self._error_banner)
                     self._error_banner.show()
                 
-                ss = self.grab()
-                from pathlib import Path
-                out = Path.cwd() / "layout_failure.png"
-                ss.save(str(out))
-                logger.error(f"Layout validation failed: overlap={overlap}, too_large={too_small}, card_bottom={card.bottom()}, prompt_top={prompt.top()}, card_h={card.height()}, saved to {out}")
-            else:
+                sig = (overlap, too_small, card_h)
+                if sig != self._last_failure_sig:
+                    self._last_failure_sig = sig
+                    logger.error(f"Layout validation failed: overlap={overlap}, too_large={too_small}, card_bottom={card_bottom}, prompt_top={prompt_top}, card_h={card_h}")
+                    if os.environ.get("SORA_DEBUG_LAYOUT"):
+                        out = Path.cwd() / "layout_failure.png"
+                        self.grab().save(str(out))
+                        logger.error(f"Saved layout failure screenshot to {out}")
+            elif self._last_failure_sig is not None or hasattr(self, "_error_banner"):
+                self._last_failure_sig = None
                 if hasattr(self, "_error_banner"):
                     self.statusBar().removeWidget(self._error_banner)
                     self._error_banner.deleteLater()
                     del self._error_banner
-                logger.info(f"Layout validation passed: card_bottom={card.bottom()}, prompt_top={prompt.top()}, gap={prompt.top() - card.bottom()}, card_h={card.height()}")
+                logger.info("Layout validation passed after earlier failure")
         except Exception as e:
             import traceback
             logger.error(f"Layout self-check exception: {e}\n{traceback.format_exc()}")
@@ -592,15 +773,21 @@ class SoraApp(QMainWindow):
             self.preview_row.set_dimensions(w, h)
     
     def _parse_size(self, text: str) -> tuple:
-        """Parse size string like '1280x720' into (w, h) using utils.aspect_of with safe fallback"""
+        """Look up size string like '1280x720' as (w, h), falling back to utils.parse_size"""
+        size = SIZE_INFO.get(text)
+        if size:
+            return size
         try:
-            return aspect_of(text)
+            return parse_size(text)
         except ValueError:
             return 1280, 720
 
     def refresh_sizes(self) -> None:
         """Refresh available sizes based on selected model"""
         m = self.model_box.currentText()
+        if m == self._last_sizes_model:
+            return
+        self._last_sizes_model = m
         sizes = SUPPORTED_SIZES.get(m, [])
         cur = self.size_box.currentText()
         self.size_box.blockSignals(True)
@@ -665,34 +852,45 @@ class SoraApp(QMainWindow):
             )
             return
         
-        try:
-            r = requests.get(
-                f"{API_BASE}/models", 
-                headers={"Authorization": f"Bearer {k}"}, 
-                timeout=TIMEOUT_TEST
-            )
-            self.last_response = {
-                "endpoint": "GET /models", 
-                "status": r.status_code, 
-                "body": safe_json(r)
-            }
-            self.show_resp_btn.setEnabled(True)
-            
-            if r.status_code == 200:
-                QMessageBox.information(self, "Success", "API key is valid!")
-            elif r.status_code == 401:
-                QMessageBox.warning(self, "Invalid", "API key is not authorized.")
+        req = QNetworkRequest(QUrl(f"{API_BASE}/models"))
+        req.setRawHeader(b"Authorization", f"Bearer {k}".encode())
+        req.setTransferTimeout(TIMEOUT_TEST * 1000)
+        self.test_key_btn.setEnabled(False)
+        reply = self._nam.get(req)
+        reply.finished.connect(lambda: self._on_test_key_finished(reply))
+    
+    def _on_test_key_finished(self, reply: QNetworkReply) -> None:
+        """Handle Test Key response"""
+        self.test_key_btn.setEnabled(True)
+        reply.deleteLater()
+        status = reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute)
+        
+        if status is None:
+            if reply.error() in (QNetworkReply.NetworkError.TimeoutError, QNetworkReply.NetworkError.OperationCanceledError):
+                QMessageBox.critical(self, "Timeout", "Request timed out. Check your internet connection.")
             else:
-                QMessageBox.warning(
-                    self, 
-                    "Error", 
-                    f"Status {r.status_code}: {r.text[:400]}"
-                )
-        except requests.exceptions.Timeout:
-            QMessageBox.critical(self, "Timeout", "Request timed out. Check your internet connection.")
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Test key failed: {e}")
-            QMessageBox.critical(self, "Network Error", f"Failed to connect: {str(e)}")
+                logger.error(f"Test key failed: {reply.errorString()}")
+                QMessageBox.critical(self, "Network Error", f"Failed to connect: {reply.errorString()}")
+            return
+        
+        data = bytes(reply.readAll())
+        self.last_response = {
+            "endpoint": "GET /models", 
+            "status": status, 
+            "body": safe_json_bytes(data)
+        }
+        self.show_resp_btn.setEnabled(True)
+        
+        if status == 200:
+            QMessageBox.information(self, "Success", "API key is valid!")
+        elif status == 401:
+            QMessageBox.warning(self, "Invalid", "API key is not authorized.")
+        else:
+            QMessageBox.warning(
+                self, 
+                "Error", 
+                f"Status {status}: {data.decode('utf-8', errors='replace')[:400]}"
+            )
 
     def show_last_response(self) -> None:
         """Show last API response in dialog"""
@@ -702,42 +900,71 @@ class SoraApp(QMainWindow):
         dlg = JsonDialog("Last API Response", self.last_response)
         dlg.exec()
 
-    def run_moderation_check(self, api_key: str, prompt: str) -> Tuple[bool, list]:
-        """Run content moderation check on prompt"""
+    def run_moderation_check(self, api_key: str, prompt: str) -> None:
+        """Start content moderation check on prompt; result arrives via moderationReady"""
+        req = QNetworkRequest(QUrl(f"{API_BASE}/moderations"))
+        req.setRawHeader(b"Authorization", f"Bearer {api_key}".encode())
+        req.setHeader(QNetworkRequest.KnownHeaders.ContentTypeHeader, "application/json")
+        req.setTransferTimeout(TIMEOUT_MODERATION * 1000)
+        payload = json.dumps({"model": "omni-moderation-latest", "input": prompt}).encode()
+        reply = self._nam.post(req, payload)
+        self._moderation_reply = reply
+        reply.finished.connect(lambda: self._on_moderation_finished(reply))
+    
+    def _on_moderation_finished(self, reply: QNetworkReply) -> None:
+        """Parse moderation response and emit moderationReady"""
+        reply.deleteLater()
+        if reply is self._moderation_reply:
+            self._moderation_reply = None
+        status = reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute)
+        
+        if status is None:
+            if reply.error() in (QNetworkReply.NetworkError.TimeoutError, QNetworkReply.NetworkError.OperationCanceledError):
+                logger.error("Moderation check timed out")
+                self.moderationReady.emit(True, ["moderation_timeout"])
+            else:
+                logger.error(f"Moderation check failed: {reply.errorString()}")
+                self.moderationReady.emit(True, [f"moderation_error: {reply.errorString()}"])
+            return
+        
+        body = safe_json_bytes(bytes(reply.readAll()))
+        self.last_response = {
+            "endpoint": "POST /moderations", 
+            "status": status, 
+            "body": body
+        }
+        self.show_resp_btn.setEnabled(True)
+        
+        if status != 200:
+            logger.warning(f"Moderation check failed: {status}")
+            self.moderationReady.emit(True, ["moderation_request_failed"])
+            return
+        
         try:
-            r = requests.post(
-                f"{API_BASE}/moderations", 
-                headers={
-                    "Authorization": f"Bearer {api_key}", 
-                    "Content-Type": "application/json"
-                }, 
-                json={"model": "omni-moderation-latest", "input": prompt}, 
-                timeout=TIMEOUT_MODERATION
-            )
-            self.last_response = {
-                "endpoint": "POST /moderations", 
-                "status": r.status_code, 
-                "body": safe_json(r)
-            }
-            self.show_resp_btn.setEnabled(True)
-            
-            if r.status_code != 200:
-                logger.warning(f"Moderation check failed: {r.status_code}")
-                return True, ["moderation_request_failed"]
-            
-            body = r.json()
             res = body.get("results", [{}])[0]
             flagged = res.get("flagged", False)
             cats = res.get("categories", {}) or {}
             reasons = [k for k, v in cats.items() if v]
-            return flagged, reasons
-        except requests.exceptions.Timeout:
-            logger.error("Moderation check timed out")
-            return True, ["moderation_timeout"]
         except Exception as e:
             logger.exception("Moderation check failed")
-            return True, [f"moderation_error: {str(e)}"]
+            self.moderationReady.emit(True, [f"moderation_error: {str(e)}"])
+            return
+        self.moderationReady.emit(bool(flagged), reasons)
 
+    def _http_session(self):
+        """Shared requests.Session for workers; called from the GUI and queue threads"""
+        with self._http_lock:
+            if self._http is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                self._http = requests.Session()
+                # Keep a pooled connection for every concurrent shot's ranged download parts
+                self._http.mount("https://", HTTPAdapter(
+                    pool_connections=4,
+                    pool_maxsize=max(8, self.shot_pool.maxThreadCount() * DOWNLOAD_PARTS)
+                ))
+            return self._http
+    
     def start_worker(self, job_id: Optional[str] = None) -> None:
         """Start worker thread for video generation"""
         k = self.api_key_edit.text().strip()
@@ -759,7 +986,7 @@ class SoraApp(QMainWindow):
             )
             return
         
-        if not check_disk_space(str(out_dir)):
+        if not _check_disk_cached(str(out_dir)):
             reply = QMessageBox.question(
                 self,
                 "Low Disk Space",
@@ -770,6 +997,7 @@ class SoraApp(QMainWindow):
                 return
         
         self.progress.setValue(0)
+        self._log_buffer.clear()
         self.log.clear()
         self.send_btn.setEnabled(False)
         
@@ -778,12 +1006,13 @@ class SoraApp(QMainWindow):
             k, m, size, sec, prompt, ref_path, 
             str(out_dir), job_id, 
             self.poll_spin.value(), 
-            self.maxwait_spin.value()
+            self.maxwait_spin.value(),
+            session=self._http_session()
         )
         self.worker.moveToThread(self.thread)
         self.thread.started.connect(self.worker.run)
         self.worker.progressed.connect(self.progress.setValue)
-        self.worker.logged.connect(self.log.appendPlainText)
+        self.worker.logged.connect(self.log_line)
         self.worker.lastresp.connect(self.capture_last_response)
         self.worker.saved.connect(self.on_saved)
         self.worker.finished.connect(self.on_finished)
@@ -794,10 +1023,12 @@ class SoraApp(QMainWindow):
     def generate_or_stop(self) -> None:
         """Generate videos or stop queue based on current state"""
         if self.queue_running:
-            self.queue_manager.stop()
+            self._cancel_shot_workers()
+            # Cancelled shots unwind on their own threads; don't hold the GUI on the joins
+            self.queue_manager.stop(timeout=0)
             self.queue_running = False
             self.send_btn.setText("⚡ Generate Now")
-            self.log.appendPlainText("Queue stopped")
+            self.log_line("Queue stopped")
             return
         
         self.generate()
@@ -821,7 +1052,7 @@ class SoraApp(QMainWindow):
         total_queued = len(status['queued']) + len(status['active'])
         
         if total_queued > 0:
-            self.log.appendPlainText(f"Starting queue with {total_queued} items...")
+            self.log_line(f"Starting queue with {total_queued} items...")
             self.send_btn.setText("⏹ Stop Queue")
             self.queue_running = True
             if not self.queue_manager._running:
@@ -834,28 +1065,46 @@ class SoraApp(QMainWindow):
             return
         
         if self.preflight_box.isChecked():
-            flagged, reasons = self.run_moderation_check(k, prompt)
-            if flagged:
-                QMessageBox.warning(
-                    self, 
-                    "Content Policy Violation", 
-                    f"Prompt flagged by moderation:\n{', '.join(reasons) or 'unspecified'}\n\n"
-                    "Please revise your prompt to comply with OpenAI's usage policies."
-                )
-                return
+            self._pending_prompt = prompt
+            self.send_btn.setEnabled(False)
+            self.log_line("Running moderation preflight...")
+            self.run_moderation_check(k, prompt)
+            return
         
+        self._continue_generate(prompt)
+    
+    def _on_moderation_ready(self, flagged: bool, reasons: list) -> None:
+        """Continue generation once the moderation preflight has finished"""
+        prompt = self._pending_prompt
+        self._pending_prompt = None
+        self.send_btn.setEnabled(True)
+        if prompt is None:
+            return
+        
+        if flagged:
+            QMessageBox.warning(
+                self, 
+                "Content Policy Violation", 
+                f"Prompt flagged by moderation:\n{', '.join(reasons) or 'unspecified'}\n\n"
+                "Please revise your prompt to comply with OpenAI's usage policies."
+            )
+            return
+        
+        self._continue_generate(prompt)
+    
+    def _continue_generate(self, prompt: str) -> None:
+        """Validate the reference image and start the worker"""
         ref_path = self.input_edit.text().strip()
         size = self.size_box.currentText()
         
-        if ref_path and Image:
+        if ref_path and _pil_image():
             if not os.path.isfile(ref_path):
                 QMessageBox.warning(self, "File Not Found", f"Reference image not found:\n{ref_path}")
                 return
             
             try:
-                w, h = aspect_of(size)
-                im = Image.open(ref_path)
-                iw, ih = im.size
+                w, h = SIZE_INFO.get(size) or parse_size(size)
+                iw, ih = self._ref_image_size(ref_path)
                 if iw != w or ih != h:
                     reply = QMessageBox.question(
                         self, 
@@ -879,6 +1128,17 @@ class SoraApp(QMainWindow):
         
         self.start_worker(job_id=None)
 
+    def _ref_image_size(self, ref_path: str) -> Tuple[int, int]:
+        """Return reference image (w, h), re-reading the header only when the file changed"""
+        st = os.stat(ref_path)
+        cached = self._ref_dim_cache.get(ref_path)
+        if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached[2]
+        with _pil_image().open(ref_path) as im:
+            dims = im.size
+        self._ref_dim_cache[ref_path] = (st.st_mtime_ns, st.st_size, dims)
+        return dims
+
     def resume_job(self) -> None:
         """Resume existing job by ID"""
         k = self.api_key_edit.text().strip()
@@ -915,18 +1175,20 @@ class SoraApp(QMainWindow):
             return
         elif clicked == add_queue_btn:
             import uuid
+            size = self.size_box.currentText()
+            w, h = SIZE_INFO.get(size) or parse_size(size)
             shot = Shot(
                 id=str(uuid.uuid4()),
                 model=self.model_box.currentText(),
-                width=int(self.size_box.currentText().split("x")[0]),
-                height=int(self.size_box.currentText().split("x")[1]),
+                width=w,
+                height=h,
                 duration_s=int(self.seconds_box.currentText()),
                 prompt=self.prompt_edit.toPlainText().strip() or f"Resume job {jid}",
                 status="queued",
                 job_id=jid
             )
             self.queue_manager.enqueue(shot)
-            self.log.appendPlainText(f"Added job {jid} to queue")
+            self.log_line(f"Added job {jid} to queue")
         else:
             self.start_worker(job_id=jid)
 
@@ -939,7 +1201,7 @@ class SoraApp(QMainWindow):
         """Handle video save completion"""
         self.last_file = path
         self.open_last_btn.setEnabled(True)
-        self.log.appendPlainText(f"Saved: {path}")
+        self.log_line(f"Saved: {path}")
 
     def on_finished(self) -> None:
         """Handle worker completion"""
@@ -953,8 +1215,8 @@ class SoraApp(QMainWindow):
 
     def on_failed(self, msg: str) -> None:
         """Handle worker failure"""
-        self.log.appendPlainText("Generation failed.")
-        self.log.appendPlainText(str(msg))
+        self.log_line("Generation failed.")
+        self.log_line(str(msg))
         self.send_btn.setEnabled(True)
         if self.thread:
             self.thread.quit()
@@ -979,7 +1241,7 @@ class SoraApp(QMainWindow):
         if not txt:
             return
         QGuiApplication.clipboard().setText(txt)
-        self.log.appendPlainText(f"Copied job ID: {txt}")
+        self.log_line(f"Copied job ID: {txt}")
     
     def add_to_queue(self) -> None:
         """Add current parameters to queue"""
@@ -992,8 +1254,9 @@ class SoraApp(QMainWindow):
             QMessageBox.warning(self, "Missing Prompt", "Please enter a prompt.")
             return
         
-        w, h = map(int, size.split("x"))
+        w, h = SIZE_INFO.get(size) or parse_size(size)
         
+        import uuid
         shot = Shot(
             id=str(uuid.uuid4()),
             model=model,
@@ -1005,22 +1268,23 @@ class SoraApp(QMainWindow):
         )
         
         self.queue_manager.enqueue(shot)
-        self.log.appendPlainText(f"Added to queue: {prompt[:50]}...")
+        self.log_line(f"Added to queue: {prompt[:50]}...")
         
         self._add_to_history(prompt)
         
         if self.current_project:
             self.current_project.shots.append(shot)
+            self._dirty_shots[shot.id] = shot
             self._mark_modified()
     
     def _process_queue_shot(self, shot: Shot) -> Tuple[bool, Optional[str]]:
         """Process a shot from the queue - called by queue worker thread"""
         try:
-            from sora_gui.worker import Worker
-            
             k = self.api_key_edit.text().strip()
             out_dir = Path(self.output_dir_edit.text().strip() or str(OUTPUT_DIR))
-            out_dir.mkdir(parents=True, exist_ok=True)
+            if str(out_dir) not in self._ensured_dirs:
+                out_dir.mkdir(parents=True, exist_ok=True)
+                self._ensured_dirs.add(str(out_dir))
             
             size_str = f"{shot.width}x{shot.height}"
             duration_str = str(shot.duration_s)
@@ -1042,40 +1306,54 @@ class SoraApp(QMainWindow):
                 k, shot.model, size_str, duration_str, shot.prompt,
                 "", out_dir, resume_job_id,
                 self.poll_spin.value(),
-                self.maxwait_spin.value()
+                self.maxwait_spin.value(),
+                session=self._http_session()
             )
             
-            result = {"success": False, "error": None}
+            result = ShotResult()
+            log_buf: list[str] = []
+            progress_val: list[Optional[int]] = [None]
+            buf_lock = threading.Lock()
+            
+            def flush():
+                with buf_lock:
+                    batch = log_buf[:]
+                    log_buf.clear()
+                    val = progress_val[0]
+                    progress_val[0] = None
+                if batch:
+                    QMetaObject.invokeMethod(
+                        self.log, "appendPlainText",
+                        Qt.ConnectionType.QueuedConnection,
+                        Q_ARG(str, "\n".join(batch))
+                    )
+                if val is not None:
+                    QMetaObject.invokeMethod(
+                        self.progress, "setValue",
+                        Qt.ConnectionType.QueuedConnection,
+                        Q_ARG(int, val)
+                    )
             
             def on_progress(val):
-                QMetaObject.invokeMethod(
-                    self.progress, "setValue",
-                    Qt.ConnectionType.QueuedConnection,
-                    Q_ARG(int, val)
-                )
+                with buf_lock:
+                    progress_val[0] = val
             
             def on_log(msg):
-                QMetaObject.invokeMethod(
-                    self.log, "appendPlainText",
-                    Qt.ConnectionType.QueuedConnection,
-                    Q_ARG(str, msg)
-                )
+                with buf_lock:
+                    log_buf.append(msg)
             
             def on_finished():
-                result["success"] = True
+                result.success = True
             
             def on_failed(msg):
-                result["error"] = str(msg)
+                result.error = str(msg)
             
             def on_saved(path):
                 if path:
                     shot.output_path = str(path)
                     logger.info(f"Set output_path for shot {shot.id}: {shot.output_path}")
-                QMetaObject.invokeMethod(
-                    self.log, "appendPlainText",
-                    Qt.ConnectionType.QueuedConnection,
-                    Q_ARG(str, f"Saved: {path}")
-                )
+                    self.shotChanged.emit(shot.id)
+                on_log(f"Saved: {path}")
             
             def on_jobid(jid):
                 QMetaObject.invokeMethod(
@@ -1084,23 +1362,40 @@ class SoraApp(QMainWindow):
                     Q_ARG(str, jid)
                 )
             
+            resp_btn_enabled = [False]
+            
             def on_lastresp(resp):
                 self.last_response = resp
-                QMetaObject.invokeMethod(
-                    self.show_resp_btn, "setEnabled",
-                    Qt.ConnectionType.QueuedConnection,
-                    Q_ARG(bool, True)
-                )
+                if not resp_btn_enabled[0]:
+                    resp_btn_enabled[0] = True
+                    QMetaObject.invokeMethod(
+                        self.show_resp_btn, "setEnabled",
+                        Qt.ConnectionType.QueuedConnection,
+                        Q_ARG(bool, True)
+                    )
             
-            worker.progressed.connect(on_progress)
-            worker.logged.connect(on_log)
-            worker.finished.connect(on_finished)
-            worker.failed.connect(on_failed)
-            worker.saved.connect(on_saved)
-            worker.jobid.connect(on_jobid)
-            worker.lastresp.connect(on_lastresp)
+            # The worker runs on a shot_pool thread; direct connections run these
+            # closures there, before runnable.done is set and result is read
+            direct = Qt.ConnectionType.DirectConnection
+            worker.progressed.connect(on_progress, direct)
+            worker.logged.connect(on_log, direct)
+            worker.finished.connect(on_finished, direct)
+            worker.failed.connect(on_failed, direct)
+            worker.saved.connect(on_saved, direct)
+            worker.jobid.connect(on_jobid, direct)
+            worker.lastresp.connect(on_lastresp, direct)
             
-            worker.run()
+            runnable = ShotRunnable(worker)
+            with self._shot_workers_lock:
+                self._shot_workers.add(worker)
+            try:
+                self.shot_pool.start(runnable)
+                while not runnable.done.wait(0.1):
+                    flush()
+            finally:
+                with self._shot_workers_lock:
+                    self._shot_workers.discard(worker)
+            flush()
             
             QMetaObject.invokeMethod(
                 self.progress, "setValue",
@@ -1108,10 +1403,9 @@ class SoraApp(QMainWindow):
                 Q_ARG(int, 100)
             )
             
-            if result["success"]:
+            if result.success:
                 return (True, None)
-            else:
-                return (False, result.get("error", "Unknown error"))
+            return (False, result.error)
                 
         except Exception as e:
             logger.error(f"Failed to process shot: {e}")
@@ -1139,12 +1433,13 @@ class SoraApp(QMainWindow):
         )
         self.current_project_path = None
         self.project_modified = False
+        self._reset_delta_tracking()
         
         if self.template_panel:
             self.template_panel._filter_templates()
         
         self._update_window_title()
-        self.log.appendPlainText("Created new project")
+        self.log_line("Created new project")
     
     def open_project(self) -> None:
         """Open a project file"""
@@ -1164,11 +1459,11 @@ class SoraApp(QMainWindow):
             self.current_project = Project.load(project_path)
             self.current_project_path = project_path
             self.project_modified = False
+            self._reset_delta_tracking()
             self._restore_project_state()
             add_recent_project(str(project_path))
-            self._update_recent_menu()
             self._update_window_title()
-            self.log.appendPlainText(f"Opened project: {project_path.name}")
+            self.log_line(f"Opened project: {project_path.name}")
         except Exception as e:
             logger.error(f"Failed to open project: {e}")
             QMessageBox.critical(self, "Error", f"Failed to open project:\n{e}")
@@ -1185,8 +1480,9 @@ class SoraApp(QMainWindow):
             self._capture_current_state()
             self.current_project.save(self.current_project_path)
             self.project_modified = False
+            self._reset_delta_tracking()
             self._update_window_title()
-            self.log.appendPlainText(f"Saved project: {self.current_project_path.name}")
+            self.log_line(f"Saved project: {self.current_project_path.name}")
             return True
         except Exception as e:
             logger.error(f"Failed to save project: {e}")
@@ -1221,10 +1517,10 @@ class SoraApp(QMainWindow):
             self.current_project.save(project_path)
             self.current_project_path = project_path
             self.project_modified = False
+            self._reset_delta_tracking()
             add_recent_project(str(project_path))
-            self._update_recent_menu()
             self._update_window_title()
-            self.log.appendPlainText(f"Saved project: {project_path.name}")
+            self.log_line(f"Saved project: {project_path.name}")
             return True
         except Exception as e:
             logger.error(f"Failed to save project: {e}")
@@ -1236,10 +1532,45 @@ class SoraApp(QMainWindow):
         if self.project_modified and self.current_project and self.current_project_path:
             try:
                 self._capture_current_state()
-                self.current_project.save(self.current_project_path)
+                shots = self.current_project.shots
+                if (len(self._dirty_shots) < len(shots) // 4
+                        and self._delta_records < 2 * len(shots)):
+                    self.current_project.save_delta(self.current_project_path, list(self._dirty_shots.values()))
+                    self._delta_records += 1
+                    self._dirty_shots.clear()
+                else:
+                    self.current_project.save(self.current_project_path)
+                    self._reset_delta_tracking()
+                self.project_modified = False
+                self._update_window_title()
                 logger.info(f"Autosaved project: {self.current_project_path.name}")
             except Exception as e:
                 logger.error(f"Autosave failed: {e}")
+                # project_modified stays set, so _apply_modified won't re-arm the timer
+                if self.autosave_timer:
+                    self.autosave_timer.start()
+    
+    def _cancel_shot_workers(self) -> None:
+        """Cancel every queued shot handed to shot_pool"""
+        with self._shot_workers_lock:
+            shot_workers = list(self._shot_workers)
+        for worker in shot_workers:
+            worker.cancel()
+    
+    def _mark_shot_dirty(self, shot_id: str) -> None:
+        """Record a changed project shot for the next delta save"""
+        if not self.current_project:
+            return
+        for shot in self.current_project.shots:
+            if shot.id == shot_id:
+                self._dirty_shots[shot_id] = shot
+                self._mark_modified()
+                return
+    
+    def _reset_delta_tracking(self) -> None:
+        """Forget pending shot deltas after a full project write or load"""
+        self._dirty_shots.clear()
+        self._delta_records = 0
     
     def _capture_current_state(self) -> None:
         if not self.current_project:
@@ -1255,26 +1586,34 @@ class SoraApp(QMainWindow):
         if not self.current_project:
             return
         
-        if self.current_project.current_model:
-            idx = self.model_box.findText(self.current_project.current_model)
-            if idx >= 0:
-                self.model_box.setCurrentIndex(idx)
-        
-        if self.current_project.current_size:
-            idx = self.size_box.findText(self.current_project.current_size)
-            if idx >= 0:
-                self.size_box.setCurrentIndex(idx)
-        
-        if self.current_project.current_duration:
-            idx = self.seconds_box.findText(str(self.current_project.current_duration))
-            if idx >= 0:
-                self.seconds_box.setCurrentIndex(idx)
-        
-        if self.current_project.current_prompt:
-            self.prompt_edit.setPlainText(self.current_project.current_prompt)
+        with ExitStack() as stack:
+            for w in (self.model_box, self.size_box, self.seconds_box, self.prompt_edit, self.output_dir_edit):
+                stack.enter_context(QSignalBlocker(w))
+            
+            if self.current_project.current_model:
+                idx = self.model_box.findText(self.current_project.current_model)
+                if idx >= 0:
+                    self.model_box.setCurrentIndex(idx)
+                    self.refresh_sizes()
+            
+            if self.current_project.current_size:
+                idx = self.size_box.findText(self.current_project.current_size)
+                if idx >= 0:
+                    self.size_box.setCurrentIndex(idx)
+            
+            if self.current_project.current_duration:
+                idx = self.seconds_box.findText(str(self.current_project.current_duration))
+                if idx >= 0:
+                    self.seconds_box.setCurrentIndex(idx)
+            
+            if self.current_project.current_prompt:
+                self.prompt_edit.setPlainText(self.current_project.current_prompt)
+            
+            if self.current_project.output_dir:
+                self.output_dir_edit.setText(self.current_project.output_dir)
         
-        if self.current_project.output_dir:
-            self.output_dir_edit.setText(self.current_project.output_dir)
+        self.on_size_change(self.size_box.currentText())
+        self._layout_check_timer.start()
     
     def _update_window_title(self) -> None:
         """Update window title with project name"""
@@ -1285,13 +1624,34 @@ class SoraApp(QMainWindow):
                 title = f"*{title}"
         self.setWindowTitle(title)
     
-    def _mark_modified(self) -> None:
-        """Mark project as modified"""
+    def _mark_modified(self, *args) -> None:
+        """Mark project as modified; bursts of edits coalesce into one update"""
+        if self.project_modified:
+            return
+        self._modify_timer.start()
+    
+    def _apply_modified(self) -> None:
+        """Set the dirty flag, update the title and schedule an autosave"""
+        if self.project_modified:
+            return
         self.project_modified = True
         self._update_window_title()
+        if self.autosave_timer:
+            self.autosave_timer.start()
     
     def closeEvent(self, event) -> None:
         """Handle window close"""
+        # Land a prompt edit still inside its debounce window before checking for changes
+        if self._prompt_debounce.isActive():
+            self._prompt_debounce.stop()
+            self._mark_modified()
+        if self._modify_timer.isActive():
+            self._modify_timer.stop()
+            self._apply_modified()
+        
+        if self.template_panel:
+            self.template_panel.flush_pending_save()
+        
         if self.project_modified and self.current_project:
             reply = QMessageBox.question(
                 self,
@@ -1307,12 +1667,28 @@ class SoraApp(QMainWindow):
                 event.ignore()
                 return
         
-        save_last_state({
+        # The close can no longer be vetoed, so drop the pending Generate and stop
+        # the worker now, letting it wind down while the remaining state is written
+        if self._moderation_reply is not None:
+            self._pending_prompt = None
+            self._moderation_reply.abort()
+        
+        if self.thread and self.thread.isRunning():
+            if self.worker:
+                self.worker.cancel()
+            self.thread.quit()
+        
+        self._flush_prompt_history()
+        
+        last_state = {
             "model": self.model_box.currentText(),
             "size": self.size_box.currentText(),
             "duration": self.seconds_box.currentText(),
             "prompt": self.prompt_edit.toPlainText()
-        })
+        }
+        if last_state != self._last_state_written:
+            save_last_state(last_state)
+            self._last_state_written = last_state
         
         try:
             geom = self.saveGeometry()
@@ -1325,24 +1701,39 @@ class SoraApp(QMainWindow):
                     left_splitter_sizes = parent.sizes()
             
             save_window_geometry({
-                "window_geometry": geom.toHex().data().decode(),
-                "splitter_state": main_state.toHex().data().decode(),
+                "encoding": "base64",
+                "window_geometry": geom.toBase64().data().decode("ascii"),
+                "splitter_state": main_state.toBase64().data().decode("ascii"),
                 "left_splitter_sizes": left_splitter_sizes
             })
             logger.info("Saved window geometry")
         except Exception as e:
             logger.error(f"Failed to save window geometry: {e}")
         
+        # Nothing below needs the window; hide it before waiting on any threads
+        self.hide()
+        
+        # Cancel queued shots first so the queue threads that stop() joins are already unwinding
+        self._cancel_shot_workers()
+        self.shot_pool.clear()
+        
+        # Cancellation is only seen between requests, so one shared deadline bounds every wait
+        deadline = time.monotonic() + 2.0
         if self.queue_manager:
             try:
-                self.queue_manager.stop()
+                self.queue_manager.stop(timeout=2.0)
             except Exception:
                 pass
+        self.shot_pool.waitForDone(max(0, int((deadline - time.monotonic()) * 1000)))
         
         if self.thread and self.thread.isRunning():
-            if self.worker:
-                self.worker.cancel()
-            self.thread.quit()
-            self.thread.wait(2000)
+            # Let the cancelled worker wind down after the window is gone
+            QGuiApplication.setQuitOnLastWindowClosed(False)
+            self.thread.finished.connect(self.thread.deleteLater)
+            self.thread.finished.connect(QGuiApplication.quit)
+            if not self.thread.isRunning():
+                QGuiApplication.quit()
+            # A request blocked on a long read timeout must not keep a hidden process alive
+            QTimer.singleShot(5000, QGuiApplication.quit)
         
         event.accept()
@@ -1,15 +1,27 @@
+from functools import lru_cache
 from math import gcd
 from PySide6.QtCore import Qt, QSize, QRect
 from PySide6.QtGui import QPainter, QPen, QColor, QFont
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, QSizePolicy, QPushButton, QDialog
 
+@lru_cache(maxsize=64)
+def _ratio(w, h):
+    g = gcd(w, h)
+    return w // g, h // g
+
 class AspectCanvas(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._w = 1280
         self._h = 720
+        self._inv_aspect = 720 / 1280
         self._label = "1280x720"
+        self._ratio = "16:9"
         self._font = QFont("Segoe UI", 10, QFont.Weight.DemiBold)
+        self._border_pen = QPen(QColor("#66AAFF"))
+        self._border_pen.setWidth(3)
+        self._text_color = QColor("#E6EAF5")
+        self._rect = QRect()
         self.setObjectName("AspectPreview")
         self._mode = "mini"
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
@@ -30,9 +42,14 @@ class AspectCanvas(QFrame):
     def set_dimensions(self, w, h):
         w = max(1, int(w))
         h = max(1, int(h))
+        if w == self._w and h == self._h:
+            return
         self._w, self._h = w, h
+        self._inv_aspect = h / w
         self._label = f"{w}x{h}"
-        self.updateGeometry()
+        self._ratio = self._ratio_text()
+        if self._mode != "mini":
+            self.updateGeometry()
         self.update()
 
     def hasHeightForWidth(self):
@@ -42,7 +59,7 @@ class AspectCanvas(QFrame):
         if self._mode == "mini":
             return self.height()
         width = max(1, int(width))
-        return max(int(width * self._h / self._w), 320)
+        return max(int(width * self._inv_aspect), 320)
 
     def sizeHint(self):
         if self._mode == "mini":
@@ -51,8 +68,8 @@ class AspectCanvas(QFrame):
         return QSize(w, self.heightForWidth(w))
 
     def _ratio_text(self):
-        g = gcd(self._w, self._h)
-        return f"{self._w//g}:{self._h//g}"
+        rw, rh = _ratio(self._w, self._h)
+        return f"{rw}:{rh}"
 
     def paintEvent(self, e):
         super().paintEvent(e)
@@ -66,14 +83,13 @@ class AspectCanvas(QFrame):
         y = r.y() + (r.height() - rh) // 2
         p = QPainter(self)
         p.setRenderHint(QPainter.RenderHint.Antialiasing, True)
-        pen = QPen(QColor("#66AAFF"))
-        pen.setWidth(3)
-        p.setPen(pen)
-        p.drawRect(QRect(x, y, rw, rh))
+        p.setPen(self._border_pen)
+        self._rect.setRect(x, y, rw, rh)
+        p.drawRect(self._rect)
         p.setFont(self._font)
-        p.setPen(QColor("#E6EAF5"))
+        p.setPen(self._text_color)
         p.drawText(x + rw - 160, y + 28, self._label)
-        p.drawText(x + rw - 160, y + 50, f"{self._w}x{self._h} • {self._ratio_text()}")
+        p.drawText(x + rw - 160, y + 50, f"{self._label} • {self._ratio}")
 
 class PreviewDialog(QDialog):
     def __init__(self, w, h, parent=None):
@@ -127,8 +143,8 @@ class CompactPreviewRow(QWidget):
 
     def set_dimensions(self, w, h):
         self.canvas.set_dimensions(w, h)
-        g = gcd(max(1, w), max(1, h))
-        self.size_label.setText(f"{w}×{h} • {w//g}:{h//g}")
+        rw, rh = _ratio(max(1, w), max(1, h))
+        self.size_label.setText(f"{w}×{h} • {rw}:{rh}")
 
     def _open_dialog(self):
         dlg = PreviewDialog(self.canvas._w, self.canvas._h, self)
@@ -1,30 +1,232 @@
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QFrame,
-    QListWidget, QListWidgetItem, QScrollArea
+    QListView, QStyledItemDelegate, QAbstractItemView
 )
-from PySide6.QtCore import Qt, Signal, QTimer
-from PySide6.QtGui import QGuiApplication
+from PySide6.QtCore import Qt, Signal, QTimer, QEvent, QUrl, QObject, QRunnable, QThreadPool, QAbstractListModel, QModelIndex, QSize, QRect
+from PySide6.QtGui import QGuiApplication, QColor, QFont, QPainter, QPixmap, QDesktopServices
+from functools import lru_cache
 from typing import Optional
 import logging
+import os
 
 from sora_core.queue import QueueManager
+from .theme import THEME
 
 logger = logging.getLogger(__name__)
 
+_ROW_HEIGHT = 50
+
+_STATUS_EMOJI = {
+    "queued": "⏳",
+    "processing": "⚙️",
+    "active": "⚙️",
+    "completed": "✅",
+    "failed": "❌",
+    "cancelled": "🚫",
+}
+_DEFAULT_EMOJI = "⏳"
+
+_EMOJI_SIZE = 24
+
+@lru_cache(maxsize=16)
+def _emoji_pixmap(emoji: str) -> QPixmap:
+    """Rasterize a status glyph once; rows then blit the pixmap instead of shaping text"""
+    dpr = QGuiApplication.instance().devicePixelRatio()
+    pix = QPixmap(int(_EMOJI_SIZE * dpr), int(_EMOJI_SIZE * dpr))
+    pix.setDevicePixelRatio(dpr)
+    pix.fill(Qt.GlobalColor.transparent)
+    p = QPainter(pix)
+    p.setPen(QColor(THEME.text))
+    p.drawText(QRect(0, 0, _EMOJI_SIZE, _EMOJI_SIZE), Qt.AlignmentFlag.AlignCenter, emoji)
+    p.end()
+    return pix
+
+@lru_cache(maxsize=512)
+def _short_prompt(prompt: str) -> str:
+    """Row title for a prompt; str caches its own hash, so repeat lookups are cheap"""
+    return prompt[:60] + "..." if len(prompt) > 60 else prompt
+
+class _StatSignals(QObject):
+    done = Signal(str, bool)
+
+class _StatTask(QRunnable):
+    """Checks whether an output file exists off the GUI thread"""
+    
+    def __init__(self, path: str, signals: _StatSignals):
+        super().__init__()
+        self.path = path
+        self.signals = signals
+    
+    def run(self) -> None:
+        self.signals.done.emit(self.path, os.path.exists(self.path))
+
+class QueueListModel(QAbstractListModel):
+    """Snapshot of QueueManager.get_all_items() for the queue view"""
+    ShotIdRole = Qt.ItemDataRole.UserRole + 1
+    ShotRole = Qt.ItemDataRole.UserRole + 2
+    StatusRole = Qt.ItemDataRole.UserRole + 3
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: list[tuple] = []
+        self._keys: list[tuple] = []
+        self._row_of: dict[str, int] = {}
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._rows):
+            return None
+        shot_id, shot, _, status_text = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return _short_prompt(shot.prompt)
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return shot.prompt
+        if role == self.ShotIdRole:
+            return shot_id
+        if role == self.ShotRole:
+            return shot
+        if role == self.StatusRole:
+            return status_text
+        return None
+    
+    def row_of(self, shot_id: str) -> Optional[int]:
+        return self._row_of.get(shot_id)
+    
+    def shot_id_at(self, row: int) -> Optional[str]:
+        if 0 <= row < len(self._rows):
+            return self._rows[row][0]
+        return None
+    
+    def set_items(self, items: list[tuple]) -> bool:
+        """Apply a new snapshot; returns True if the model had to be reset"""
+        old_ids = [row[0] for row in self._rows]
+        new_ids = [row[0] for row in items]
+        keys = [(row[3], getattr(row[1], 'job_id', None)) for row in items]
+        
+        if new_ids != old_ids and len(new_ids) == len(old_ids) and set(new_ids) == set(old_ids):
+            # Pure reorder: relayout in one pass and keep persistent indexes (and index widgets)
+            old_keys = dict(zip(old_ids, self._keys))
+            self.layoutAboutToBeChanged.emit()
+            row_of = {shot_id: i for i, shot_id in enumerate(new_ids)}
+            old_persistent = self.persistentIndexList()
+            new_persistent = [self.index(row_of[old_ids[index.row()]]) for index in old_persistent]
+            self._rows = list(items)
+            self._keys = keys
+            self._row_of = row_of
+            self.changePersistentIndexList(old_persistent, new_persistent)
+            self.layoutChanged.emit()
+            for i, shot_id in enumerate(new_ids):
+                if keys[i] != old_keys[shot_id]:
+                    index = self.index(i)
+                    self.dataChanged.emit(index, index)
+            return False
+        
+        if new_ids[:len(old_ids)] != old_ids:
+            self.beginResetModel()
+            self._rows = list(items)
+            self._keys = keys
+            self._row_of = {shot_id: i for i, shot_id in enumerate(new_ids)}
+            self.endResetModel()
+            return True
+        
+        changed = [i for i in range(len(old_ids)) if keys[i] != self._keys[i]]
+        if len(new_ids) > len(old_ids):
+            self.beginInsertRows(QModelIndex(), len(old_ids), len(new_ids) - 1)
+            self._rows = list(items)
+            for i in range(len(old_ids), len(new_ids)):
+                self._row_of[new_ids[i]] = i
+            self._keys = keys
+            self.endInsertRows()
+        else:
+            self._rows = list(items)
+            self._keys = keys
+        for i in changed:
+            index = self.index(i)
+            self.dataChanged.emit(index, index)
+        return False
+
+class QueueItemDelegate(QStyledItemDelegate):
+    """Paints collapsed queue rows as cards; expanded rows carry a real card widget"""
+    
+    def __init__(self, view: QListView):
+        super().__init__(view)
+        self._view = view
+        self._border = QColor(THEME.border)
+        self._surface = QColor(THEME.surface)
+        self._text = QColor(THEME.text)
+        self._arrow_font = QFont()
+        self._arrow_font.setPixelSize(16)
+        self._arrow_font.setBold(True)
+    
+    def sizeHint(self, option, index) -> QSize:
+        width = self._view.viewport().width() - 2 * self._view.spacing()
+        widget = self._view.indexWidget(index)
+        if widget is None:
+            return QSize(width, _ROW_HEIGHT)
+        if widget.hasHeightForWidth():
+            return QSize(width, widget.heightForWidth(width))
+        return QSize(width, widget.sizeHint().height())
+    
+    def paint(self, painter, option, index) -> None:
+        if self._view.indexWidget(index) is not None:
+            return
+        shot = index.data(QueueListModel.ShotRole)
+        status_text = index.data(QueueListModel.StatusRole)
+        
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        painter.setPen(self._border)
+        painter.setBrush(self._surface)
+        painter.drawRoundedRect(option.rect.adjusted(0, 0, -1, -1), 14, 14)
+        
+        r = option.rect.adjusted(12, 12, -12, -12)
+        painter.setPen(self._text)
+        painter.setFont(option.font)
+        x = r.x()
+        emoji_y = r.y() + (r.height() - _EMOJI_SIZE) // 2
+        painter.drawPixmap(x, emoji_y, _emoji_pixmap(_STATUS_EMOJI.get(status_text, _DEFAULT_EMOJI)))
+        x += 34
+        if getattr(shot, 'job_id', None):
+            painter.drawPixmap(x, emoji_y, _emoji_pixmap("🔄"))
+            x += 34
+        
+        arrow_rect = QRect(r.right() - 24, r.y(), 24, r.height())
+        text_rect = QRect(x, r.y(), arrow_rect.left() - 10 - x, r.height())
+        prompt = option.fontMetrics.elidedText(
+            index.data(Qt.ItemDataRole.DisplayRole), Qt.TextElideMode.ElideRight, text_rect.width()
+        )
+        painter.drawText(text_rect, Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, prompt)
+        painter.setFont(self._arrow_font)
+        painter.drawText(arrow_rect, Qt.AlignmentFlag.AlignCenter, "▶")
+        painter.restore()
+
 class QueuePanel(QWidget):
     shot_selected = Signal(str)
+    _queue_changed = Signal()
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.queue_manager: Optional[QueueManager] = None
         self.last_request_id: str = ""
         self.expanded_items: set[str] = set()
-        self._last_item_count: int = 0
+        self._signature: int = 0
+        self._last_total: int = -1
+        self._cards: dict[str, QFrame] = {}
+        self._stale: bool = False
+        self._output_exists: dict[str, Optional[bool]] = {}
+        self._open_when_known: Optional[str] = None
+        self._stat_signals = _StatSignals(self)
+        self._stat_signals.done.connect(self._on_stat_done)
         self._setup_ui()
         
-        self.update_timer = QTimer(self)
-        self.update_timer.timeout.connect(self._refresh_queue)
-        self.update_timer.start(500)
+        # Status callbacks arrive on queue worker threads; coalesce them on the GUI thread
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(33)
+        self._refresh_timer.timeout.connect(self._refresh_queue)
+        self._queue_changed.connect(self._refresh_timer.start, Qt.ConnectionType.QueuedConnection)
     
     def _setup_ui(self) -> None:
         layout = QVBoxLayout(self)
@@ -48,18 +250,21 @@ class QueuePanel(QWidget):
         self.status_label.setProperty("muted", True)
         layout.addWidget(self.status_label)
         
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setFrameShape(QFrame.Shape.NoFrame)
-        
-        self.scroll_content = QWidget()
-        self.scroll_layout = QVBoxLayout(self.scroll_content)
-        self.scroll_layout.setContentsMargins(0, 0, 0, 0)
-        self.scroll_layout.setSpacing(8)
-        self.scroll_layout.addStretch()
-        
-        self.scroll_area.setWidget(self.scroll_content)
-        layout.addWidget(self.scroll_area, 1)
+        # Only rows the user expanded get real widgets; the rest are painted
+        self.model = QueueListModel(self)
+        self.list_view = QListView()
+        self.list_view.setObjectName("QueueList")
+        self.list_view.setFrameShape(QFrame.Shape.NoFrame)
+        self.list_view.setSpacing(4)
+        self.list_view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.list_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.list_view.setResizeMode(QListView.ResizeMode.Adjust)
+        self.list_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.list_view.setModel(self.model)
+        self.delegate = QueueItemDelegate(self.list_view)
+        self.list_view.setItemDelegate(self.delegate)
+        self.list_view.clicked.connect(self._on_row_clicked)
+        layout.addWidget(self.list_view, 1)
         
         footer = QFrame()
         footer.setProperty("card", True)
@@ -80,66 +285,77 @@ class QueuePanel(QWidget):
     
     def set_queue_manager(self, qm: QueueManager) -> None:
         self.queue_manager = qm
+        qm.add_status_listener(self._on_queue_status)
         self._refresh_queue()
     
+    def _on_queue_status(self, shot_id: str, status: str) -> None:
+        self._queue_changed.emit()
+    
     def set_last_request_id(self, request_id: str) -> None:
         self.last_request_id = request_id
         self.request_id_text.setText(request_id)
     
+    def showEvent(self, e) -> None:
+        super().showEvent(e)
+        if self._stale:
+            self._refresh_queue()
+    
     def _refresh_queue(self) -> None:
         if not self.queue_manager:
             return
+        if not self.isVisible():
+            # On a background tab; catch up in showEvent
+            self._stale = True
+            return
+        self._stale = False
         
-        status = self.queue_manager.get_queue_status()
-        total = len(status['queued']) + len(status['active'])
-        self.status_label.setText(
-            f"{total} items • {len(status['active'])} active"
-        )
-        
+        # One snapshot under the manager lock; everything below works on the copy
         items = self.queue_manager.get_all_items()
-        
-        current_items = {}
-        for i in range(self.scroll_layout.count() - 1):
-            widget = self.scroll_layout.itemAt(i).widget()
-            if widget and widget.objectName().startswith("queue_item_"):
-                shot_id = widget.objectName().replace("queue_item_", "")
-                current_items[shot_id] = widget
-        
-        new_shot_ids = {shot_id for shot_id, _, _, _ in items}
-        
-        for shot_id in list(current_items.keys()):
-            if shot_id not in new_shot_ids:
-                current_items[shot_id].deleteLater()
-                del current_items[shot_id]
-        
-        for idx, (shot_id, shot, priority, status_text) in enumerate(items):
-            if shot_id not in current_items:
-                item_widget = self._create_queue_item(shot_id, shot, status_text)
-                self.scroll_layout.insertWidget(idx, item_widget)
-            else:
-                existing = current_items[shot_id]
-                self._update_queue_item(existing, shot_id, shot, status_text)
-                current_idx = self.scroll_layout.indexOf(existing)
-                if current_idx != idx:
-                    self.scroll_layout.removeWidget(existing)
-                    self.scroll_layout.insertWidget(idx, existing)
-    
-    def _update_queue_item(self, item: QFrame, shot_id: str, shot, status_text: str) -> None:
-        """Update an existing queue item widget"""
-        layout = item.layout()
-        if not layout:
+        active = sum(1 for _, _, _, st in items if st == "active")
+        total = active + sum(1 for _, _, _, st in items if st == "queued")
+        
+        sig = hash(tuple(
+            (sid, st, getattr(sh, 'job_id', None), sid in self.expanded_items)
+            for sid, sh, _, st in items
+        ))
+        if sig == self._signature and total == self._last_total:
             return
+        self._signature = sig
+        self._last_total = total
         
-        is_expanded = shot_id in self.expanded_items
+        self.status_label.setText(
+            f"{total} items • {active} active"
+        )
         
-        if is_expanded and layout.count() == 1:
-            details = self._create_details_section(shot_id, shot, status_text)
-            layout.addWidget(details)
-        elif not is_expanded and layout.count() > 1:
-            details_widget = layout.itemAt(1).widget()
-            if details_widget:
-                layout.removeWidget(details_widget)
-                details_widget.deleteLater()
+        self.list_view.setUpdatesEnabled(False)
+        try:
+            if self.model.set_items(items):
+                # A reset drops every index widget along with the old rows
+                self._cards.clear()
+            self.expanded_items.intersection_update(self.model._row_of)
+            
+            for shot_id in list(self._cards):
+                if shot_id not in self.expanded_items:
+                    self._set_card(shot_id, None)
+            for shot_id in self.expanded_items:
+                row = self.model.row_of(shot_id)
+                _, shot, _, status_text = items[row]
+                self._set_card(shot_id, self._create_queue_item(shot_id, shot, status_text))
+        finally:
+            self.list_view.setUpdatesEnabled(True)
+    
+    def _set_card(self, shot_id: str, card: Optional[QFrame]) -> None:
+        """Attach (or with None, drop) the widget shown for an expanded row"""
+        index = self.model.index(self.model.row_of(shot_id))
+        self.list_view.setIndexWidget(index, card)
+        if card is None:
+            self._cards.pop(shot_id, None)
+        else:
+            self._cards[shot_id] = card
+        self.delegate.sizeHintChanged.emit(index)
+    
+    def _on_row_clicked(self, index: QModelIndex) -> None:
+        self._toggle_expand(index.data(QueueListModel.ShotIdRole))
     
     def _create_queue_item(self, shot_id: str, shot, status_text: str) -> QFrame:
         item = QFrame()
@@ -154,41 +370,37 @@ class QueuePanel(QWidget):
         header = QWidget()
         header.setCursor(Qt.CursorShape.PointingHandCursor)
         header.setAttribute(Qt.WidgetAttribute.WA_Hover, False)
-        header.mousePressEvent = lambda e: self._toggle_expand(shot_id, item)
+        header.setProperty("shot_id", shot_id)
+        header.installEventFilter(self)
         
         header_layout = QHBoxLayout(header)
         header_layout.setContentsMargins(0, 0, 0, 0)
         header_layout.setSpacing(10)
         
-        status_emoji = {
-            "queued": "⏳",
-            "processing": "⚙️",
-            "active": "⚙️",
-            "completed": "✅",
-            "failed": "❌",
-            "cancelled": "🚫"
-        }.get(status_text, "⏳")
+        status_emoji = _STATUS_EMOJI.get(status_text, _DEFAULT_EMOJI)
         
-        status_label = QLabel(status_emoji)
+        status_label = QLabel()
+        status_label.setPixmap(_emoji_pixmap(status_emoji))
         status_label.setMinimumHeight(24)
         header_layout.addWidget(status_label)
         
         resume_job_id = getattr(shot, 'job_id', None)
         if resume_job_id:
-            resume_icon = QLabel("🔄")
+            resume_icon = QLabel()
+            resume_icon.setPixmap(_emoji_pixmap("🔄"))
             resume_icon.setToolTip(f"Resume job: {resume_job_id}")
             resume_icon.setMinimumHeight(24)
             header_layout.addWidget(resume_icon)
         
-        prompt = shot.prompt[:60] + "..." if len(shot.prompt) > 60 else shot.prompt
+        prompt = _short_prompt(shot.prompt)
         prompt_label = QLabel(prompt)
         prompt_label.setWordWrap(True)
         prompt_label.setMinimumHeight(24)
-        prompt_label.setStyleSheet("padding: 6px 0px;")
+        prompt_label.setProperty("queueRow", "title")
         header_layout.addWidget(prompt_label, 1)
         
         arrow_label = QLabel("▼ " if shot_id in self.expanded_items else "▶ ")
-        arrow_label.setStyleSheet("font-size: 16px; font-weight: bold;")
+        arrow_label.setProperty("queueRow", "arrow")
         arrow_label.setMinimumHeight(24)
         header_layout.addWidget(arrow_label)
         
@@ -212,34 +424,34 @@ class QueuePanel(QWidget):
         if resume_job_id:
             resume_label = QLabel(f"🔄 Resume Job ID: {resume_job_id}")
             resume_label.setMinimumHeight(22)
-            resume_label.setStyleSheet("padding: 4px 0px; color: #4a9eff; font-weight: bold;")
+            resume_label.setProperty("queueRow", "resume")
             details_layout.addWidget(resume_label)
         
         model_label = QLabel(f"Model: {shot.model}")
         model_label.setMinimumHeight(22)
-        model_label.setStyleSheet("padding: 4px 0px;")
+        model_label.setProperty("queueRow", "detail")
         details_layout.addWidget(model_label)
         
         size_label = QLabel(f"Size: {shot.width}x{shot.height}")
         size_label.setMinimumHeight(22)
-        size_label.setStyleSheet("padding: 4px 0px;")
+        size_label.setProperty("queueRow", "detail")
         details_layout.addWidget(size_label)
         
         duration_label = QLabel(f"Duration: {shot.duration_s}s")
         duration_label.setMinimumHeight(22)
-        duration_label.setStyleSheet("padding: 4px 0px;")
+        duration_label.setProperty("queueRow", "detail")
         details_layout.addWidget(duration_label)
         
         status_label = QLabel(f"Status: {status_text}")
         status_label.setMinimumHeight(22)
-        status_label.setStyleSheet("padding: 4px 0px;")
+        status_label.setProperty("queueRow", "detail")
         details_layout.addWidget(status_label)
         
         prompt_detail = QLabel(f"Prompt:\n{shot.prompt}")
         prompt_detail.setWordWrap(True)
         prompt_detail.setProperty("muted", True)
         prompt_detail.setMinimumHeight(70)
-        prompt_detail.setStyleSheet("padding: 8px 0px;")
+        prompt_detail.setProperty("queueRow", "prompt")
         details_layout.addWidget(prompt_detail)
         
         actions = QWidget()
@@ -254,9 +466,9 @@ class QueuePanel(QWidget):
             cancel_btn.setMinimumHeight(32)
             cancel_btn.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
             cancel_btn.setAttribute(Qt.WidgetAttribute.WA_Hover, True)
-            def cancel_click(sid=shot_id):
-                self._cancel_shot(sid)
-            cancel_btn.clicked.connect(cancel_click)
+            cancel_btn.setProperty("shot_id", shot_id)
+            cancel_btn.setProperty("action", "cancel")
+            cancel_btn.clicked.connect(self._dispatch_action)
             actions_layout.addWidget(cancel_btn)
         
         up_btn = QPushButton("↑")
@@ -264,9 +476,9 @@ class QueuePanel(QWidget):
         up_btn.setMinimumHeight(32)
         up_btn.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
         up_btn.setAttribute(Qt.WidgetAttribute.WA_Hover, True)
-        def up_click(sid=shot_id):
-            self._move_up(sid)
-        up_btn.clicked.connect(up_click)
+        up_btn.setProperty("shot_id", shot_id)
+        up_btn.setProperty("action", "up")
+        up_btn.clicked.connect(self._dispatch_action)
         actions_layout.addWidget(up_btn)
         
         down_btn = QPushButton("↓")
@@ -274,32 +486,24 @@ class QueuePanel(QWidget):
         down_btn.setMinimumHeight(32)
         down_btn.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
         down_btn.setAttribute(Qt.WidgetAttribute.WA_Hover, True)
-        def down_click(sid=shot_id):
-            self._move_down(sid)
-        down_btn.clicked.connect(down_click)
+        down_btn.setProperty("shot_id", shot_id)
+        down_btn.setProperty("action", "down")
+        down_btn.clicked.connect(self._dispatch_action)
         actions_layout.addWidget(down_btn)
         
         if status_text == "completed":
             output_file = getattr(shot, 'output_path', None)
-            logger.info(f"Queue item {shot_id}: status={status_text}, output_path={output_file}, type={type(output_file)}")
+            logger.debug("Queue item %s: status=%s, output_path=%r, type=%s",
+                         shot_id, status_text, output_file, type(output_file).__name__)
             if output_file and isinstance(output_file, str) and output_file != "":
                 open_btn = QPushButton("📁 Open Video")
                 open_btn.setMinimumHeight(32)
-                open_btn.setStyleSheet("QPushButton { background: #2d5016; }")
-                
-                actual_path = str(output_file)
-                
-                def open_video():
-                    from PySide6.QtCore import QUrl
-                    from PySide6.QtGui import QDesktopServices
-                    import os
-                    logger.info(f"Opening video: {actual_path}, exists={os.path.exists(actual_path)}")
-                    if os.path.exists(actual_path):
-                        QDesktopServices.openUrl(QUrl.fromLocalFile(actual_path))
-                    else:
-                        logger.warning(f"Video file not found: {actual_path}")
-                
-                open_btn.clicked.connect(open_video)
+                open_btn.setProperty("variant", "open")
+                open_btn.setProperty("shot_id", shot_id)
+                open_btn.setProperty("action", "open")
+                open_btn.setProperty("path", str(output_file))
+                self._request_stat(str(output_file))
+                open_btn.clicked.connect(self._dispatch_action)
                 actions_layout.addWidget(open_btn)
         
         actions_layout.addStretch()
@@ -307,7 +511,51 @@ class QueuePanel(QWidget):
         
         return details
     
-    def _toggle_expand(self, shot_id: str, item_widget: QFrame) -> None:
+    def eventFilter(self, obj, event) -> bool:
+        """Card headers route their clicks here instead of patching mousePressEvent"""
+        if event.type() == QEvent.Type.MouseButtonPress:
+            shot_id = obj.property("shot_id")
+            if shot_id:
+                self._toggle_expand(shot_id)
+                return True
+        return super().eventFilter(obj, event)
+    
+    def _dispatch_action(self) -> None:
+        btn = self.sender()
+        action = btn.property("action")
+        if action == "open":
+            self._open_video(btn.property("path"))
+            return
+        handler = {
+            "cancel": self._cancel_shot,
+            "up": self._move_up,
+            "down": self._move_down,
+        }[action]
+        handler(btn.property("shot_id"))
+    
+    def _request_stat(self, path: str) -> None:
+        if path not in self._output_exists:
+            self._output_exists[path] = None
+            QThreadPool.globalInstance().start(_StatTask(path, self._stat_signals))
+    
+    def _on_stat_done(self, path: str, exists: bool) -> None:
+        self._output_exists[path] = exists
+        if path == self._open_when_known:
+            self._open_when_known = None
+            logger.debug("Opening video: %s, exists=%s", path, exists)
+            if exists:
+                QDesktopServices.openUrl(QUrl.fromLocalFile(path))
+            else:
+                logger.warning("Video file not found: %s", path)
+    
+    def _open_video(self, path: str) -> None:
+        # The file may have gone since the card was built, so check again (off the GUI
+        # thread; network paths can be slow) and open once the answer arrives
+        self._open_when_known = path
+        self._output_exists.pop(path, None)
+        self._request_stat(path)
+    
+    def _toggle_expand(self, shot_id: str) -> None:
         if shot_id in self.expanded_items:
             self.expanded_items.remove(shot_id)
         else:
@@ -315,28 +563,21 @@ class QueuePanel(QWidget):
         self._refresh_queue()
     
     def _move_up(self, shot_id: str) -> None:
-        if not self.queue_manager:
-            return
-        
-        items = self.queue_manager.get_all_items()
-        ids = [sid for sid, _, _, _ in items]
-        if shot_id in ids:
-            idx = ids.index(shot_id)
-            if idx > 0:
-                ids[idx], ids[idx-1] = ids[idx-1], ids[idx]
-                self.queue_manager.reorder(ids)
+        self._move_by(shot_id, -1)
     
     def _move_down(self, shot_id: str) -> None:
+        self._move_by(shot_id, 1)
+    
+    def _move_by(self, shot_id: str, offset: int) -> None:
         if not self.queue_manager:
             return
         
-        items = self.queue_manager.get_all_items()
-        ids = [sid for sid, _, _, _ in items]
-        if shot_id in ids:
-            idx = ids.index(shot_id)
-            if idx < len(ids) - 1:
-                ids[idx], ids[idx+1] = ids[idx+1], ids[idx]
-                self.queue_manager.reorder(ids)
+        row = self.model.row_of(shot_id)
+        if row is None:
+            return
+        other = self.model.shot_id_at(row + offset)
+        if other and self.queue_manager.swap(shot_id, other):
+            self._refresh_queue()
     
     def _cancel_shot(self, shot_id: str) -> None:
         if not self.queue_manager:
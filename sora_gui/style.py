@@ -1,18 +1,25 @@
+from functools import lru_cache
 from pathlib import Path
-from .theme import THEME
+from .theme import THEME, Theme
 
-def apply(app):
-    qss = Path(__file__).with_name("style_base.qss").read_text(encoding="utf-8")
-    qss = qss.format(
-        BG=THEME.bg,
-        SURFACE=THEME.surface,
-        SURFACE_ALT=THEME.surface_alt,
-        BORDER=THEME.border,
-        TEXT=THEME.text,
-        TEXT_MUTED=THEME.text_muted,
-        TEXT_DISABLED=THEME.text_disabled,
-        PRIMARY_START=THEME.primary_start,
-        PRIMARY_MID=THEME.primary_mid,
-        PRIMARY_END=THEME.primary_end,
+@lru_cache(maxsize=1)
+def _template() -> str:
+    return Path(__file__).with_name("style_base.qss").read_text(encoding="utf-8")
+
+@lru_cache(maxsize=4)
+def _render(theme: Theme) -> str:
+    return _template().format(
+        BG=theme.bg,
+        SURFACE=theme.surface,
+        SURFACE_ALT=theme.surface_alt,
+        BORDER=theme.border,
+        TEXT=theme.text,
+        TEXT_MUTED=theme.text_muted,
+        TEXT_DISABLED=theme.text_disabled,
+        PRIMARY_START=theme.primary_start,
+        PRIMARY_MID=theme.primary_mid,
+        PRIMARY_END=theme.primary_end,
     )
-    app.setStyleSheet(qss)
+
+def apply(app):
+    app.setStyleSheet(_render(THEME))
@@ -1,19 +1,179 @@
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QFrame,
-    QLineEdit, QScrollArea, QMessageBox, QDialog, QFormLayout, QTextEdit,
-    QComboBox, QCheckBox
+    QLineEdit, QMessageBox, QDialog, QFormLayout, QTextEdit,
+    QComboBox, QCheckBox, QListView, QStyledItemDelegate, QAbstractItemView
 )
-from PySide6.QtCore import Qt, Signal, QTimer
-from PySide6.QtGui import QGuiApplication
+from PySide6.QtCore import (
+    Qt, Signal, Slot, QTimer, QRunnable, QThreadPool, QEvent, QAbstractListModel, QModelIndex, QSize, QRect
+)
+from PySide6.QtGui import QGuiApplication, QColor, QFont, QPainter
+from bisect import bisect_right
+from dataclasses import fields
 from typing import Optional, List
 import logging
+import sys
 import uuid
 
 from sora_core.models import Template
 from sora_gui.config import get_templates, save_templates
+from sora_gui.theme import THEME
 
 logger = logging.getLogger(__name__)
 
+_TEMPLATE_FIELDS = tuple(f.name for f in fields(Template))
+
+def _template_to_dict(t: Template) -> dict:
+    data = {k: getattr(t, k) for k in _TEMPLATE_FIELDS}
+    # The snapshot is serialized on another thread; don't share the mutable list
+    data["tags"] = list(t.tags)
+    return data
+
+def _intern_template(t: Template) -> Template:
+    """Share the low-cardinality strings (model, tags) across templates"""
+    t.model = sys.intern(t.model)
+    t.tags = [sys.intern(tag) for tag in t.tags]
+    return t
+
+_ROW_HEIGHT = 50
+
+def _template_icons(t: Template) -> str:
+    icons = []
+    if t.pinned:
+        icons.append("⭐")
+    if t.starred:
+        icons.append("★")
+    return " ".join(icons)
+
+def _tags_preview(t: Template) -> str:
+    preview = ", ".join(t.tags[:3])
+    if len(t.tags) > 3:
+        preview += "..."
+    return preview
+
+class _SaveTemplatesTask(QRunnable):
+    """Writes a template snapshot to the global config off the GUI thread"""
+    
+    def __init__(self, templates_data: list):
+        super().__init__()
+        self.templates_data = templates_data
+    
+    def run(self) -> None:
+        save_templates(self.templates_data)
+
+class TemplateListModel(QAbstractListModel):
+    """The filtered templates shown by TemplatePanel"""
+    TemplateIdRole = Qt.ItemDataRole.UserRole + 1
+    TemplateRole = Qt.ItemDataRole.UserRole + 2
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._templates: List[Template] = []
+        self._row_of: dict[str, int] = {}
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._templates)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._templates):
+            return None
+        t = self._templates[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return t.name
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return t.prompt
+        if role == self.TemplateIdRole:
+            return t.id
+        if role == self.TemplateRole:
+            return t
+        return None
+    
+    def row_of(self, template_id: str) -> Optional[int]:
+        return self._row_of.get(template_id)
+    
+    def set_templates(self, templates: List[Template]) -> bool:
+        """Show a new filter result; returns True if the model had to be reset"""
+        if [t.id for t in templates] == [t.id for t in self._templates]:
+            # Same rows: repaint in place and keep index widgets
+            self._templates = list(templates)
+            if templates:
+                self.dataChanged.emit(self.index(0), self.index(len(templates) - 1))
+            return False
+        self.beginResetModel()
+        self._templates = list(templates)
+        self._row_of = {t.id: i for i, t in enumerate(templates)}
+        self.endResetModel()
+        return True
+
+class TemplateItemDelegate(QStyledItemDelegate):
+    """Paints collapsed template rows as cards; expanded rows carry a real card widget"""
+    
+    def __init__(self, view: QListView):
+        super().__init__(view)
+        self._view = view
+        self._border = QColor(THEME.border)
+        self._surface = QColor(THEME.surface)
+        self._text = QColor(THEME.text)
+        self._muted = QColor(THEME.text_muted)
+        self._name_font: Optional[QFont] = None
+        self._arrow_font = QFont()
+        self._arrow_font.setPixelSize(16)
+        self._arrow_font.setBold(True)
+    
+    def sizeHint(self, option, index) -> QSize:
+        width = self._view.viewport().width() - 2 * self._view.spacing()
+        widget = self._view.indexWidget(index)
+        if widget is None:
+            return QSize(width, _ROW_HEIGHT)
+        if widget.hasHeightForWidth():
+            return QSize(width, widget.heightForWidth(width))
+        return QSize(width, widget.sizeHint().height())
+    
+    def paint(self, painter, option, index) -> None:
+        if self._view.indexWidget(index) is not None:
+            return
+        t = index.data(TemplateListModel.TemplateRole)
+        if self._name_font is None:
+            self._name_font = QFont(option.font)
+            self._name_font.setWeight(QFont.Weight.DemiBold)
+        
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        painter.setPen(self._border)
+        painter.setBrush(self._surface)
+        painter.drawRoundedRect(option.rect.adjusted(0, 0, -1, -1), 14, 14)
+        
+        r = option.rect.adjusted(12, 12, -12, -12)
+        align = Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft
+        painter.setPen(self._text)
+        painter.setFont(option.font)
+        x = r.x()
+        icons = _template_icons(t)
+        if icons:
+            icons_width = option.fontMetrics.horizontalAdvance(icons)
+            painter.drawText(QRect(x, r.y(), icons_width, r.height()), align, icons)
+            x += icons_width + 8
+        
+        arrow_rect = QRect(r.right() - 24, r.y(), 24, r.height())
+        right = arrow_rect.left() - 8
+        if t.tags:
+            tags = _tags_preview(t)
+            tags_width = min(option.fontMetrics.horizontalAdvance(tags), (right - x) // 2)
+            tags_rect = QRect(right - tags_width, r.y(), tags_width, r.height())
+            painter.setPen(self._muted)
+            painter.drawText(tags_rect, align, option.fontMetrics.elidedText(
+                tags, Qt.TextElideMode.ElideRight, tags_width
+            ))
+            painter.setPen(self._text)
+            right = tags_rect.left() - 8
+        
+        painter.setFont(self._name_font)
+        name_rect = QRect(x, r.y(), right - x, r.height())
+        name = painter.fontMetrics().elidedText(t.name, Qt.TextElideMode.ElideRight, name_rect.width())
+        painter.drawText(name_rect, align, name)
+        painter.setFont(self._arrow_font)
+        painter.drawText(arrow_rect, Qt.AlignmentFlag.AlignCenter, "▶")
+        painter.restore()
+
 class TemplateDialog(QDialog):
     def __init__(self, template: Optional[Template] = None, parent=None):
         super().__init__(parent)
@@ -108,6 +268,7 @@ class TemplateDialog(QDialog):
         
         layout.addLayout(buttons)
     
+    @Slot()
     def _save(self):
         name = self.name_edit.text().strip()
         prompt = self.prompt_edit.toPlainText().strip()
@@ -167,6 +328,29 @@ class TemplatePanel(QWidget):
         self.filtered_templates: List[Template] = []
         self.expanded_items: set[str] = set()
         self.main_window = None
+        self._meta: dict[str, tuple] = {}
+        self._corpus: Optional[str] = None
+        self._corpus_starts: list[int] = []
+        self._corpus_templates: List[Template] = []
+        self._pinned_ids: set[str] = set()
+        self._starred_ids: set[str] = set()
+        self._flag_views: dict[tuple, List[Template]] = {}
+        self._cards: dict[str, QFrame] = {}
+        self._by_id: dict[str, Template] = {}
+        self._pos: dict[str, int] = {}
+        self._last_query: Optional[tuple] = None
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._filter_templates)
+        # One writer thread keeps background saves in submission order
+        self._save_pool = QThreadPool(self)
+        self._save_pool.setMaxThreadCount(1)
+        self._save_dirty = False
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(250)
+        self._save_timer.timeout.connect(self._do_save_background)
         self._setup_ui()
         self._load_templates()
     
@@ -193,7 +377,7 @@ class TemplatePanel(QWidget):
         
         self.search_edit = QLineEdit()
         self.search_edit.setPlaceholderText("Search templates...")
-        self.search_edit.textChanged.connect(self._filter_templates)
+        self.search_edit.textChanged.connect(self._schedule_filter)
         search_row.addWidget(self.search_edit, 1)
         
         self.filter_pinned = QCheckBox("⭐ Pinned")
@@ -210,64 +394,187 @@ class TemplatePanel(QWidget):
         self.status_label.setProperty("muted", True)
         layout.addWidget(self.status_label)
         
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setFrameShape(QFrame.Shape.NoFrame)
-        
-        self.scroll_content = QWidget()
-        self.scroll_layout = QVBoxLayout(self.scroll_content)
-        self.scroll_layout.setContentsMargins(0, 0, 0, 0)
-        self.scroll_layout.setSpacing(8)
-        self.scroll_layout.addStretch()
-        
-        self.scroll_area.setWidget(self.scroll_content)
-        layout.addWidget(self.scroll_area, 1)
+        # Only rows the user expanded get real widgets; the rest are painted
+        self.model = TemplateListModel(self)
+        self.list_view = QListView()
+        self.list_view.setObjectName("TemplateList")
+        self.list_view.setFrameShape(QFrame.Shape.NoFrame)
+        self.list_view.setSpacing(4)
+        self.list_view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.list_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.list_view.setResizeMode(QListView.ResizeMode.Adjust)
+        self.list_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.list_view.setModel(self.model)
+        self.delegate = TemplateItemDelegate(self.list_view)
+        self.list_view.setItemDelegate(self.delegate)
+        self.list_view.clicked.connect(self._on_row_clicked)
+        layout.addWidget(self.list_view, 1)
     
     def set_templates(self, templates: List[Template]):
         self.templates = templates
+        self._reindex()
+        self._invalidate()
         self._filter_templates()
     
     def _load_templates(self):
         """Load templates from global config"""
         templates_data = get_templates()
-        self.templates = [Template(**t) for t in templates_data]
+        self.templates = [_intern_template(Template(**t)) for t in templates_data]
+        self._reindex()
+        self._invalidate()
         self._filter_templates()
     
     def _save_templates(self):
-        """Save templates to global config"""
-        from dataclasses import asdict
-        templates_data = [asdict(t) for t in self.templates]
-        save_templates(templates_data)
+        """Schedule a save of templates to global config"""
+        self._save_dirty = True
+        self._save_timer.start()
+    
+    def _snapshot_templates(self) -> list:
+        self._save_dirty = False
+        return [_template_to_dict(t) for t in self.templates]
+    
+    @Slot()
+    def _do_save_background(self):
+        if self._save_dirty:
+            self._save_pool.start(_SaveTemplatesTask(self._snapshot_templates()))
     
+    def flush_pending_save(self):
+        """Write any scheduled template save now and wait for background writes"""
+        self._save_timer.stop()
+        self._do_save_background()
+        self._save_pool.waitForDone()
+    
+    def _invalidate(self, template_id: Optional[str] = None):
+        """Drop cached sort/search metadata and expanded cards (for one template or all) and force the next filter to rescan"""
+        if template_id is None:
+            self._meta.clear()
+            stale = list(self._cards)
+        else:
+            self._meta.pop(template_id, None)
+            stale = [template_id] if template_id in self._cards else []
+        if stale:
+            self.list_view.setUpdatesEnabled(False)
+            try:
+                for card_id in stale:
+                    self._set_card(card_id, None)
+            finally:
+                self.list_view.setUpdatesEnabled(True)
+        self._corpus = None
+        self._last_query = None
+    
+    def _reindex(self):
+        """Rebuild the id -> template and id -> list position indexes"""
+        self._by_id = {t.id: t for t in self.templates}
+        self._pos = {t.id: i for i, t in enumerate(self.templates)}
+    
+    def _add_template(self, template: Template):
+        self._pos[template.id] = len(self.templates)
+        self._by_id[template.id] = template
+        self.templates.append(template)
+    
+    def _remove_template(self, template: Template):
+        """Remove in O(1) by moving the last template into the freed slot"""
+        i = self._pos.pop(template.id)
+        del self._by_id[template.id]
+        last = self.templates.pop()
+        if last is not template:
+            self.templates[i] = last
+            self._pos[last.id] = i
+    
+    
+    def _meta_of(self, t: Template) -> tuple:
+        """Return (sort_key, searchable_casefolded) for a template, computing it once"""
+        meta = self._meta.get(t.id)
+        if meta is None:
+            meta = (
+                (not t.pinned, not t.starred, t.name),
+                f"{t.name} {t.prompt} {' '.join(t.tags)}".casefold(),
+            )
+            self._meta[t.id] = meta
+        return meta
+    
+    def _ensure_corpus(self):
+        """Build one NUL-separated, casefolded haystack over all templates in display order"""
+        if self._corpus is not None:
+            return
+        ordered = sorted(self.templates, key=lambda t: self._meta_of(t)[0])
+        starts = []
+        pos = 0
+        for t in ordered:
+            starts.append(pos)
+            pos += len(self._meta_of(t)[1]) + 1
+        self._corpus = "\0".join(self._meta_of(t)[1] for t in ordered)
+        self._corpus_starts = starts
+        self._corpus_templates = ordered
+        self._pinned_ids = {t.id for t in ordered if t.pinned}
+        self._starred_ids = {t.id for t in ordered if t.starred}
+        # Results for each (pinned, starred) checkbox combination with no search text;
+        # pinned templates sort first, so that view is a prefix
+        self._flag_views = {
+            (False, False): ordered,
+            (True, False): ordered[:len(self._pinned_ids)],
+            (False, True): [t for t in ordered if t.starred],
+            (True, True): [t for t in ordered if t.pinned and t.starred],
+        }
+    
+    def _search_corpus(self, search_text: str) -> List[Template]:
+        """Return matching templates in display order using str.find over the corpus"""
+        hay = self._corpus
+        starts = self._corpus_starts
+        count = len(starts)
+        matches = []
+        pos = hay.find(search_text)
+        while pos != -1:
+            i = bisect_right(starts, pos) - 1
+            matches.append(self._corpus_templates[i])
+            if i + 1 >= count:
+                break
+            pos = hay.find(search_text, starts[i + 1])
+        return matches
+    
+    @Slot()
+    def _schedule_filter(self):
+        self._search_timer.start()
+    
+    @Slot()
     def _filter_templates(self):
-        search_text = self.search_edit.text().strip().lower()
+        search_text = self.search_edit.text().strip().casefold()
         show_pinned = self.filter_pinned.isChecked()
         show_starred = self.filter_starred.isChecked()
         
-        self.filtered_templates = []
-        for t in self.templates:
-            if show_pinned and not t.pinned:
-                continue
-            if show_starred and not t.starred:
-                continue
-            
-            if search_text:
-                searchable = f"{t.name} {t.prompt} {' '.join(t.tags)}".lower()
-                if search_text not in searchable:
-                    continue
-            
-            self.filtered_templates.append(t)
-        
-        self.filtered_templates.sort(key=lambda t: (not t.pinned, not t.starred, t.name))
+        query = (search_text, show_pinned, show_starred)
+        last = self._last_query
+        if query == last:
+            return
+        self._last_query = query
+        
+        # A longer query with the same flags can only narrow the previous result,
+        # which is already flag-filtered and sorted
+        if last is not None and last[1:] == query[1:] and search_text.startswith(last[0]):
+            self.filtered_templates = [
+                t for t in self.filtered_templates if search_text in self._meta_of(t)[1]
+            ]
+            self._refresh_templates()
+            return
+        
+        self._ensure_corpus()
+        if not search_text:
+            self.filtered_templates = list(self._flag_views[(show_pinned, show_starred)])
+            self._refresh_templates()
+            return
+        
+        candidates = self._search_corpus(search_text)
+        if show_pinned or show_starred:
+            candidates = [
+                t for t in candidates
+                if (not show_pinned or t.id in self._pinned_ids)
+                and (not show_starred or t.id in self._starred_ids)
+            ]
+        self.filtered_templates = list(candidates)
         
         self._refresh_templates()
     
     def _refresh_templates(self):
-        while self.scroll_layout.count() > 1:
-            item = self.scroll_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
         total = len(self.templates)
         shown = len(self.filtered_templates)
         
@@ -276,9 +583,30 @@ class TemplatePanel(QWidget):
         else:
             self.status_label.setText(f"{shown}/{total} templates")
         
-        for template in self.filtered_templates:
-            item_widget = self._create_template_item(template)
-            self.scroll_layout.insertWidget(self.scroll_layout.count() - 1, item_widget)
+        self.list_view.setUpdatesEnabled(False)
+        try:
+            if self.model.set_templates(self.filtered_templates):
+                # A reset drops every index widget along with the old rows
+                self._cards.clear()
+            for template in self.filtered_templates:
+                if template.id in self.expanded_items and template.id not in self._cards:
+                    self._set_card(template.id, self._create_template_item(template))
+        finally:
+            self.list_view.setUpdatesEnabled(True)
+    
+    def _set_card(self, template_id: str, card: Optional[QFrame]):
+        """Attach (or with None, drop) the widget shown for an expanded row"""
+        index = self.model.index(self.model.row_of(template_id))
+        self.list_view.setIndexWidget(index, card)
+        if card is None:
+            self._cards.pop(template_id, None)
+        else:
+            self._cards[template_id] = card
+        self.delegate.sizeHintChanged.emit(index)
+    
+    @Slot(QModelIndex)
+    def _on_row_clicked(self, index: QModelIndex):
+        self._toggle_expand(index.data(TemplateListModel.TemplateIdRole))
     
     def _create_template_item(self, template: Template) -> QFrame:
         item = QFrame()
@@ -291,47 +619,39 @@ class TemplatePanel(QWidget):
         
         header = QWidget()
         header.setCursor(Qt.CursorShape.PointingHandCursor)
-        header.mousePressEvent = lambda e: self._toggle_expand(template.id, item)
+        header.setProperty("template_id", template.id)
+        header.installEventFilter(self)
         
         header_layout = QHBoxLayout(header)
         header_layout.setContentsMargins(0, 0, 0, 0)
         header_layout.setSpacing(8)
         
-        icons = []
-        if template.pinned:
-            icons.append("⭐")
-        if template.starred:
-            icons.append("★")
-        
+        icons = _template_icons(template)
         if icons:
-            icon_label = QLabel(" ".join(icons))
+            icon_label = QLabel(icons)
             icon_label.setMinimumHeight(24)
             header_layout.addWidget(icon_label)
         
         name_label = QLabel(template.name)
-        name_label.setStyleSheet("font-weight: 600; padding: 6px 0px;")
+        name_label.setProperty("templateRow", "name")
         name_label.setMinimumHeight(24)
         header_layout.addWidget(name_label, 1)
         
         if template.tags:
-            tags_preview = ", ".join(template.tags[:3])
-            if len(template.tags) > 3:
-                tags_preview += "..."
-            tags_label = QLabel(tags_preview)
+            tags_label = QLabel(_tags_preview(template))
             tags_label.setProperty("muted", True)
             tags_label.setMinimumHeight(24)
             header_layout.addWidget(tags_label)
         
         arrow_label = QLabel("▼ " if template.id in self.expanded_items else "▶ ")
-        arrow_label.setStyleSheet("font-size: 16px; font-weight: bold;")
+        arrow_label.setProperty("templateRow", "arrow")
         arrow_label.setMinimumHeight(24)
         header_layout.addWidget(arrow_label)
         
         layout.addWidget(header)
         
         if template.id in self.expanded_items:
-            details = self._create_details_section(template)
-            layout.addWidget(details)
+            layout.addWidget(self._create_details_section(template))
         
         return item
     
@@ -345,28 +665,28 @@ class TemplatePanel(QWidget):
         prompt_label.setWordWrap(True)
         prompt_label.setProperty("muted", True)
         prompt_label.setMinimumHeight(40)
-        prompt_label.setStyleSheet("padding: 8px 0px;")
+        prompt_label.setProperty("templateRow", "prompt")
         details_layout.addWidget(prompt_label)
         
         model_label = QLabel(f"Model: {template.model}")
         model_label.setMinimumHeight(22)
-        model_label.setStyleSheet("padding: 4px 0px;")
+        model_label.setProperty("templateRow", "detail")
         details_layout.addWidget(model_label)
         
         size_label = QLabel(f"Size: {template.width}x{template.height}")
         size_label.setMinimumHeight(22)
-        size_label.setStyleSheet("padding: 4px 0px;")
+        size_label.setProperty("templateRow", "detail")
         details_layout.addWidget(size_label)
         
         duration_label = QLabel(f"Duration: {template.duration_s}s")
         duration_label.setMinimumHeight(22)
-        duration_label.setStyleSheet("padding: 4px 0px;")
+        duration_label.setProperty("templateRow", "detail")
         details_layout.addWidget(duration_label)
         
         if template.tags:
             tags_label = QLabel(f"Tags: {', '.join(template.tags)}")
             tags_label.setMinimumHeight(22)
-            tags_label.setStyleSheet("padding: 4px 0px;")
+            tags_label.setProperty("templateRow", "detail")
             details_layout.addWidget(tags_label)
         
         actions = QWidget()
@@ -377,17 +697,23 @@ class TemplatePanel(QWidget):
         apply_btn = QPushButton("Apply Template")
         apply_btn.setProperty("variant", "primary")
         apply_btn.setMinimumHeight(32)
-        apply_btn.clicked.connect(lambda: self._apply_template(template))
+        apply_btn.setProperty("template_id", template.id)
+        apply_btn.setProperty("action", "apply")
+        apply_btn.clicked.connect(self._dispatch_action)
         actions_layout.addWidget(apply_btn)
         
         edit_btn = QPushButton("Edit")
         edit_btn.setMinimumHeight(32)
-        edit_btn.clicked.connect(lambda: self._edit_template(template))
+        edit_btn.setProperty("template_id", template.id)
+        edit_btn.setProperty("action", "edit")
+        edit_btn.clicked.connect(self._dispatch_action)
         actions_layout.addWidget(edit_btn)
         
         delete_btn = QPushButton("Delete")
         delete_btn.setMinimumHeight(32)
-        delete_btn.clicked.connect(lambda: self._delete_template(template))
+        delete_btn.setProperty("template_id", template.id)
+        delete_btn.setProperty("action", "delete")
+        delete_btn.clicked.connect(self._dispatch_action)
         actions_layout.addWidget(delete_btn)
         
         actions_layout.addStretch()
@@ -395,25 +721,55 @@ class TemplatePanel(QWidget):
         
         return details
     
-    def _toggle_expand(self, template_id: str, item_widget: QFrame):
+    def eventFilter(self, obj, event) -> bool:
+        """Card headers route their clicks here instead of patching mousePressEvent"""
+        if event.type() == QEvent.Type.MouseButtonPress:
+            template_id = obj.property("template_id")
+            if template_id:
+                self._toggle_expand(template_id)
+                return True
+        return super().eventFilter(obj, event)
+    
+    def _toggle_expand(self, template_id: str):
+        row = self.model.row_of(template_id)
+        if row is None:
+            return
         if template_id in self.expanded_items:
             self.expanded_items.remove(template_id)
+            self._set_card(template_id, None)
         else:
             self.expanded_items.add(template_id)
-        self._refresh_templates()
+            template = self.model.index(row).data(TemplateListModel.TemplateRole)
+            self._set_card(template_id, self._create_template_item(template))
+    
+    @Slot()
+    def _dispatch_action(self):
+        btn = self.sender()
+        template = self._by_id.get(btn.property("template_id"))
+        if template is None:
+            return
+        handler = {
+            "apply": self._apply_template,
+            "edit": self._edit_template,
+            "delete": self._delete_template,
+        }[btn.property("action")]
+        handler(template)
     
+    @Slot()
     def _create_template(self):
         dlg = TemplateDialog(parent=self)
         if dlg.exec() == QDialog.DialogCode.Accepted:
             new_template = dlg.get_template()
-            self.templates.append(new_template)
+            self._add_template(new_template)
             self._save_templates()
+            self._invalidate(new_template.id)
             self._filter_templates()
     
     def _edit_template(self, template: Template):
         dlg = TemplateDialog(template=template, parent=self)
         if dlg.exec() == QDialog.DialogCode.Accepted:
             self._save_templates()
+            self._invalidate(template.id)
             self._filter_templates()
     
     def _delete_template(self, template: Template):
@@ -425,10 +781,11 @@ class TemplatePanel(QWidget):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            self.templates.remove(template)
+            self._remove_template(template)
             if template.id in self.expanded_items:
                 self.expanded_items.remove(template.id)
             self._save_templates()
+            self._invalidate(template.id)
             self._filter_templates()
     
     def _apply_template(self, template: Template):
@@ -1,46 +1,80 @@
 """Utility functions"""
 import json
 import logging
+import re
 import shutil
+from functools import lru_cache
 from pathlib import Path
-from typing import Tuple, Dict, Any, Optional
-from requests import Response
+from typing import TYPE_CHECKING, Tuple, Dict, Any, Optional
+
+from .constants import API_KEY_PREFIX, MIN_API_KEY_LENGTH
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if TYPE_CHECKING:
+    from requests import Response
 
 logger = logging.getLogger(__name__)
 
+_SIZE_RE = re.compile(r"\s*(\d+)\s*[xX]\s*(\d+)\s*")
+
+@lru_cache(maxsize=32)
 def parse_size(size_str: str) -> Tuple[int, int]:
     """Parse aspect ratio string like '1280x720' into (width, height).
     
     Raises:
         ValueError: If size_str format is invalid
     """
-    try:
-        parts = size_str.lower().split("x")
-        if len(parts) != 2:
-            raise ValueError(f"Invalid size format: {size_str}")
-        w, h = int(parts[0]), int(parts[1])
-        if w <= 0 or h <= 0:
-            raise ValueError(f"Size dimensions must be positive: {w}x{h}")
-        return w, h
-    except (ValueError, IndexError) as e:
-        raise ValueError(f"Failed to parse size '{size_str}': {e}") from e
+    m = _SIZE_RE.fullmatch(size_str)
+    if not m:
+        raise ValueError(f"Failed to parse size '{size_str}': Invalid size format: {size_str}")
+    w, h = int(m.group(1)), int(m.group(2))
+    if w <= 0 or h <= 0:
+        raise ValueError(f"Failed to parse size '{size_str}': Size dimensions must be positive: {w}x{h}")
+    return w, h
 
-def aspect_of(size_str: str) -> Tuple[int, int]:
-    """Legacy alias for parse_size. Use parse_size instead."""
-    return parse_size(size_str)
+def _looks_like_json(data: bytes) -> bool:
+    """Cheap pre-check so non-JSON bodies skip the parse-and-raise path"""
+    return data.lstrip()[:1] in (b"{", b"[")
 
-def safe_json(resp: Response) -> Dict[str, Any]:
+def _loads(data: bytes) -> Any:
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def safe_json(resp: "Response") -> Dict[str, Any]:
     """Safely extract JSON from response, with fallbacks"""
+    content = resp.content or b""
+    if "json" in resp.headers.get("content-type", "") or _looks_like_json(content):
+        try:
+            return _loads(content)
+        except ValueError:
+            pass
     try:
-        return resp.json()
-    except ValueError:
+        return {"text": resp.text}
+    except Exception:
+        return {"error": "unreadable response"}
+
+def safe_json_bytes(data: bytes) -> Dict[str, Any]:
+    """Safely decode a raw JSON body, with the same fallbacks as safe_json"""
+    if _looks_like_json(data):
         try:
-            return {"text": resp.text}
-        except Exception:
-            return {"error": "unreadable response"}
+            return _loads(data)
+        except ValueError:
+            pass
+    try:
+        return {"text": data.decode("utf-8", errors="replace")}
+    except Exception:
+        return {"error": "unreadable response"}
 
 def pretty(obj: Any) -> str:
     """Format object as pretty-printed JSON"""
+    if orjson:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass
     return json.dumps(obj, ensure_ascii=False, indent=2)
 
 def check_disk_space(path: str, required_bytes: int = 5_000_000_000) -> bool:
@@ -57,6 +91,7 @@ def check_disk_space(path: str, required_bytes: int = 5_000_000_000) -> bool:
         logger.warning(f"Failed to check disk space at '{path}': {e}. Assuming sufficient space.")
         return True
 
+@lru_cache(maxsize=8)
 def validate_api_key(key: str) -> bool:
     """Validate API key format.
     
@@ -66,7 +101,6 @@ def validate_api_key(key: str) -> bool:
     Returns:
         True if key appears valid, False otherwise
     """
-    from .constants import API_KEY_PREFIX, MIN_API_KEY_LENGTH
     return key.startswith(API_KEY_PREFIX) and len(key) > MIN_API_KEY_LENGTH
 
 def validate_file_path(path: str) -> Optional[str]:
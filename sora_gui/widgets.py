@@ -1,20 +1,33 @@
 """Custom widgets"""
+from math import gcd
+
 from PySide6.QtWidgets import QFrame, QSizePolicy
 from PySide6.QtCore import QSize
-from PySide6.QtGui import QPainter, QColor, QPen, QFont
+from PySide6.QtGui import QPainter, QColor, QPen, QFont, QFontMetrics
 
 from .theme import THEME
 
 class AspectPreview(QFrame):
+    _FRAME_COLOR = QColor(THEME.primary_mid)
+    _TEXT_COLOR = QColor(THEME.text)
+    _CAPTION_COLOR = QColor(THEME.text_muted)
+
     def __init__(self):
         super().__init__()
         self.size_str = "1280x720"
         self._aspect = (16, 9)
+        self._dims = (1280, 720)
+        self._caption_text = "1280×720 • 16:9"
         self.setObjectName("AspectPreview")
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self.setMinimumHeight(220)
         self._caption_font = QFont("Segoe UI", 10, QFont.Weight.DemiBold)
         self._text_font = QFont("Segoe UI", 12, QFont.Weight.Bold)
+        self._caption_metrics = QFontMetrics(self._caption_font)
+        self._text_metrics = QFontMetrics(self._text_font)
+        self._text_widths = None
+        self._frame_pen = QPen(self._FRAME_COLOR)
+        self._frame_pen.setWidth(3)
 
     def hasHeightForWidth(self):
         return True
@@ -31,21 +44,24 @@ class AspectPreview(QFrame):
         return QSize(w, self.heightForWidth(w))
 
     def set_size_str(self, s):
+        if s == self.size_str:
+            return
         self.size_str = s
+        self._text_widths = None
+        # Parse once here so paintEvent is arithmetic and drawing only
         parts = s.split("x")
         if len(parts) == 2:
             aw, ah = int(parts[0]), int(parts[1])
-            gcd_val = self._gcd(aw, ah)
+            gcd_val = gcd(aw, ah) or 1
             self._aspect = (aw // gcd_val, ah // gcd_val)
+            self._dims = (aw, ah) if aw > 0 and ah > 0 else None
+            ar = f"{aw // gcd_val}:{ah // gcd_val}" if aw and ah else ""
+            self._caption_text = f"{aw}×{ah} • {ar}"
         else:
             self._aspect = (16, 9)
+            self._dims = None
         self.updateGeometry()
         self.update()
-    
-    def _gcd(self, a, b):
-        while b:
-            a, b = b, a % b
-        return a
 
     def paintEvent(self, e):
         super().paintEvent(e)
@@ -53,10 +69,9 @@ class AspectPreview(QFrame):
         if r.width() <= 2 or r.height() <= 2:
             return
         
-        parts = self.size_str.split("x")
-        if len(parts) != 2:
+        if self._dims is None:
             return
-        aw, ah = int(parts[0]), int(parts[1])
+        aw, ah = self._dims
         
         scale = min(r.width() / aw, r.height() / ah)
         rw = int(aw * scale)
@@ -67,22 +82,22 @@ class AspectPreview(QFrame):
         p = QPainter(self)
         p.setRenderHint(QPainter.RenderHint.Antialiasing, True)
         
-        pen = QPen(QColor(THEME.primary_mid))
-        pen.setWidth(3)
-        p.setPen(pen)
+        p.setPen(self._frame_pen)
         p.drawRect(x, y, rw, rh)
 
-        p.setFont(self._text_font)
-        p.setPen(QColor(THEME.text))
         text1 = self.size_str
-        text1_width = p.fontMetrics().horizontalAdvance(text1)
-        p.drawText(x + (rw - text1_width) // 2, y + rh // 2 - 10, text1)
+        text2 = self._caption_text
+        if self._text_widths is None:
+            self._text_widths = (
+                self._text_metrics.horizontalAdvance(text1),
+                self._caption_metrics.horizontalAdvance(text2),
+            )
+        text1_width, text2_width = self._text_widths
         
-        gcd_val = self._gcd(aw, ah)
-        ar = f"{aw // gcd_val}:{ah // gcd_val}" if aw and ah else ""
-        text2 = f"{aw}×{ah} • {ar}"
+        p.setFont(self._text_font)
+        p.setPen(self._TEXT_COLOR)
+        p.drawText(x + (rw - text1_width) // 2, y + rh // 2 - 10, text1)
         
         p.setFont(self._caption_font)
-        p.setPen(QColor(THEME.text_muted))
-        text2_width = p.fontMetrics().horizontalAdvance(text2)
+        p.setPen(self._CAPTION_COLOR)
         p.drawText(x + (rw - text2_width) // 2, y + rh // 2 + 15, text2)
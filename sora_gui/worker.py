@@ -2,23 +2,113 @@
 import os
 import time
 import random
+import shutil
 import mimetypes
 import logging
+import threading
 from pathlib import Path
 from collections import deque
-from typing import Optional, Dict, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Dict, Any, Tuple
 
-import requests
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QRunnable, Signal
 
 from .constants import (
-    API_BASE, DOWNLOAD_CHUNK_SIZE, TIMEOUT_POST, TIMEOUT_GET, 
-    TIMEOUT_DOWNLOAD, MAX_BACKOFF, BACKOFF_MULTIPLIER, STUCK_CHECK_INTERVAL
+    API_BASE, DOWNLOAD_CHUNK_SIZE, DOWNLOAD_PARTS, PARALLEL_DOWNLOAD_MIN_SIZE, WRITE_BATCH_SIZE,
+    TIMEOUT_POST, TIMEOUT_GET, 
+    TIMEOUT_DOWNLOAD, MAX_BACKOFF, BACKOFF_MULTIPLIER,
+    MAX_POLL_INTERVAL, POLL_RATE_ALPHA, MAX_ERROR_BODY_SIZE
 )
-from .utils import safe_json, pretty
+from .utils import safe_json, safe_json_bytes, pretty
+
+if TYPE_CHECKING:
+    import requests
 
 logger = logging.getLogger(__name__)
 
+# requests (and urllib3 behind it) is imported when the first worker is built, not at GUI startup
+
+@lru_cache(maxsize=1)
+def _multipart_encoder():
+    """requests-toolbelt's MultipartEncoder, or None when it isn't installed"""
+    try:
+        from requests_toolbelt.multipart.encoder import MultipartEncoder
+    except ImportError:
+        return None
+    return MultipartEncoder
+
+def _fadvise(fd: int, advice: str) -> None:
+    """Best-effort page-cache hint; a no-op where posix_fadvise is unavailable (Windows, macOS)"""
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, getattr(os, advice))
+        except OSError:
+            pass
+
+def _preallocate(f, size: int) -> None:
+    """Reserve size bytes up front so the filesystem can lay the file out in one extent"""
+    if hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(f.fileno(), 0, size)
+            return
+        except OSError:
+            pass
+    f.truncate(size)
+
+def _release_pages(path: Path) -> None:
+    """Flush a finished download and let the kernel drop its cached pages"""
+    with open(path, "r+b") as f:
+        if hasattr(os, "fdatasync"):
+            os.fdatasync(f.fileno())
+        _fadvise(f.fileno(), "POSIX_FADV_DONTNEED")
+
+class _GatherWriter:
+    """Collects chunks and writes each batch with one os.writev call (a joined write where writev is missing)"""
+    
+    def __init__(self, f):
+        self._f = f
+        self._chunks: list = []
+        self._size = 0
+    
+    def write(self, chunk: bytes) -> int:
+        self._chunks.append(chunk)
+        self._size += len(chunk)
+        if self._size >= WRITE_BATCH_SIZE or len(self._chunks) >= 64:
+            self.flush()
+        return len(chunk)
+    
+    def flush(self) -> None:
+        if not self._chunks:
+            return
+        if hasattr(os, "writev"):
+            self._f.flush()
+            fd = self._f.fileno()
+            views = [memoryview(c) for c in self._chunks]
+            while views:
+                written = os.writev(fd, views)
+                # Drop fully written buffers and trim a partially written one
+                while views and written >= len(views[0]):
+                    written -= len(views.pop(0))
+                if views and written:
+                    views[0] = views[0][written:]
+        else:
+            self._f.write(b"".join(self._chunks))
+        self._chunks = []
+        self._size = 0
+
+class _CancellableStream:
+    """File-like view of a response stream that reports EOF once the worker is cancelled"""
+    
+    def __init__(self, raw, worker: "Worker"):
+        self._read = raw.read
+        self._worker = worker
+    
+    def read(self, n: int = -1) -> bytes:
+        if self._worker._cancelled:
+            return b""
+        return self._read(n)
+
 class Worker(QObject):
     progressed = Signal(int)
     logged = Signal(str)
@@ -30,7 +120,8 @@ class Worker(QObject):
 
     def __init__(self, api_key: str, model: str, size: str, seconds: str, prompt: str, 
                  ref_path: str, out_dir: str, job_id: Optional[str], 
-                 poll_every: int, max_minutes: int):
+                 poll_every: int, max_minutes: int, session: Optional["requests.Session"] = None,
+                 chunk_size: int = DOWNLOAD_CHUNK_SIZE):
         super().__init__()
         self.api_key = api_key
         self.model = model
@@ -43,57 +134,190 @@ class Worker(QObject):
         self.poll_every = poll_every
         self.max_minutes = max_minutes
         self.req_ids = deque(maxlen=10)
+        self._last_emitted: Optional[Tuple[str, int, Dict[str, Any]]] = None
+        self._last_raw: Optional[Tuple[bytes, Dict[str, Any]]] = None
         self._cancelled = False
+        self._cancel_event = threading.Event()
+        if session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_maxsize=max(10, DOWNLOAD_PARTS)))
+        self.session = session
+        self.chunk_size = chunk_size
 
     def cancel(self) -> None:
         """Cancel the worker operation"""
         self._cancelled = True
+        self._cancel_event.set()
         logger.info("Worker cancellation requested")
 
-    def record(self, resp: requests.Response, endpoint: str) -> Dict[str, Any]:
+    def _sleep(self, seconds: float) -> bool:
+        """Sleep that returns as soon as the worker is cancelled; True if it was"""
+        return self._cancel_event.wait(seconds)
+
+    @staticmethod
+    def _retry_after(resp: "requests.Response") -> Optional[float]:
+        try:
+            return max(0.0, float(resp.headers.get("Retry-After", "")))
+        except ValueError:
+            return None
+
+    def record(self, resp: "requests.Response", endpoint: str) -> Dict[str, Any]:
         """Record API response and emit signal"""
         rid = resp.headers.get("x-request-id") or resp.headers.get("X-Request-Id")
-        body = safe_json(resp)
+        # Byte-identical bodies (common mid-job) reuse the previous parse
+        content = resp.content
+        if self._last_raw is not None and content == self._last_raw[0]:
+            body = self._last_raw[1]
+        elif resp.status_code != 200 and len(content) > MAX_ERROR_BODY_SIZE:
+            logger.warning(f"{endpoint} returned a {len(content)} byte error body; truncated for display")
+            body = safe_json_bytes(content[:MAX_ERROR_BODY_SIZE])
+            if isinstance(body, dict):
+                body["truncated"] = True
+        else:
+            body = safe_json(resp)
+            self._last_raw = (content, body)
+        if rid:
+            self.req_ids.append(rid)
+        # Repeated identical polls (e.g. stuck at 99%) needn't cross into the GUI thread again
+        key = (endpoint, resp.status_code, body)
+        if key == self._last_emitted:
+            return body
+        self._last_emitted = key
         payload = {"endpoint": endpoint, "status": resp.status_code, "body": body}
         if rid:
             payload["request_id"] = rid
-            self.req_ids.append(rid)
         self.lastresp.emit(payload)
         return body
     
+    @staticmethod
+    def _range_total(resp: "requests.Response") -> Optional[int]:
+        """Total size from a 206 'Content-Range: bytes 0-N/TOTAL', if the body can be fetched in parts"""
+        if DOWNLOAD_PARTS < 2 or resp.status_code != 206 or resp.headers.get("Content-Encoding", "identity") != "identity":
+            return None
+        content_range = resp.headers.get("Content-Range", "")
+        try:
+            total = int(content_range.rsplit("/", 1)[1])
+        except (IndexError, ValueError):
+            return None
+        return total if total >= PARALLEL_DOWNLOAD_MIN_SIZE else None
+    
+    def _copy_exact(self, raw, f, length: int, abort: threading.Event) -> bool:
+        """Copy exactly length bytes from raw into f; False if cancelled or aborted midway"""
+        read = raw.read
+        out = _GatherWriter(f)
+        remaining = length
+        while remaining > 0:
+            if self._cancelled or abort.is_set():
+                return False
+            chunk = read(min(self.chunk_size, remaining))
+            if not chunk:
+                raise IOError(f"Connection closed with {remaining} bytes of the range left")
+            out.write(chunk)
+            remaining -= len(chunk)
+        out.flush()
+        return True
+    
+    def _fetch_range(self, url: str, headers: Dict[str, str], start: int, end: int,
+                     temp_path: Path, abort: threading.Event) -> None:
+        part_headers = dict(headers, Range=f"bytes={start}-{end}")
+        try:
+            with self.session.get(url, headers=part_headers, timeout=TIMEOUT_DOWNLOAD, stream=True) as r:
+                if r.status_code != 206:
+                    raise IOError(f"Range {start}-{end} returned status {r.status_code}")
+                with open(temp_path, "r+b") as f:
+                    f.seek(start)
+                    # A cancel is picked up by _download_video; anything else left the range unfinished
+                    if not self._copy_exact(r.raw, f, end - start + 1, abort) and not self._cancelled:
+                        raise IOError(f"Range {start}-{end} aborted")
+        except BaseException:
+            # Stop the sibling ranges as soon as this one fails
+            abort.set()
+            raise
+    
+    def _download_parts(self, dr: "requests.Response", url: str, headers: Dict[str, str],
+                        total: int, temp_path: Path) -> None:
+        """Fetch the rest of a ranged response concurrently while streaming the first part from dr"""
+        part_size = -(-total // DOWNLOAD_PARTS)
+        ranges = [(start, min(start + part_size, total) - 1) for start in range(0, total, part_size)]
+        with open(temp_path, "wb") as f:
+            _preallocate(f, total)
+        # Set on the first failure so the remaining parts stop instead of finishing for nothing
+        abort = threading.Event()
+        with ThreadPoolExecutor(max_workers=len(ranges) - 1) as pool:
+            futures = [
+                pool.submit(self._fetch_range, url, headers, start, end, temp_path, abort)
+                for start, end in ranges[1:]
+            ]
+            try:
+                with open(temp_path, "r+b") as f:
+                    complete = self._copy_exact(dr.raw, f, ranges[0][1] + 1, abort)
+                dr.close()
+                # A sibling's failure is what aborts part 0, so surface that error first
+                for future in futures:
+                    future.result()
+                if not complete and not self._cancelled:
+                    raise IOError(f"Range 0-{ranges[0][1]} aborted")
+            except BaseException:
+                abort.set()
+                raise
+    
     def _download_video(self, headers: Dict[str, str], body: Dict[str, Any]) -> Optional[Path]:
         """Download video content and return path, or None on failure"""
         fn = f"{self.job_id}_{body.get('model', self.model)}_{body.get('size', self.size)}_{body.get('seconds', self.seconds)}s.mp4"
         out_path = self.out_dir / fn
         temp_path = out_path.with_suffix('.tmp')
+        url = f"{API_BASE}/videos/{self.job_id}/content"
         dr = None
+        # MP4 is already compressed; asking for identity keeps urllib3 off its decoder path
+        headers = dict(headers, **{"Accept-Encoding": "identity"})
         
         try:
             self.logged.emit("Downloading video...")
-            dr = requests.get(
-                f"{API_BASE}/videos/{self.job_id}/content", 
-                headers=headers, 
+            # An open-ended range costs nothing when unsupported (plain 200) and
+            # otherwise tells us the size so large files can be split across connections
+            dr = self.session.get(
+                url, 
+                headers=dict(headers, Range="bytes=0-"), 
                 timeout=TIMEOUT_DOWNLOAD, 
                 stream=True
             )
-            dbody = {"streamed": dr.status_code == 200}
+            dbody = {"streamed": dr.status_code in (200, 206)}
             self.lastresp.emit({
                 "endpoint": f"GET /videos/{self.job_id}/content", 
                 "status": dr.status_code, 
                 "body": dbody
             })
             
-            if dr.status_code != 200:
+            if dr.status_code not in (200, 206):
                 self.failed.emit(f"Download error {dr.status_code}")
                 return None
             
-            with open(temp_path, "wb") as f:
-                for chunk in dr.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
-                    if self._cancelled:
-                        logger.info("Download cancelled")
-                        return None
-                    if chunk:
-                        f.write(chunk)
+            total = self._range_total(dr)
+            if total is not None:
+                self._download_parts(dr, url, headers, total, temp_path)
+            else:
+                # Copy the urllib3 stream directly rather than through iter_content's
+                # generator; only decode if the server ignored Accept-Encoding
+                size = int(dr.headers.get("Content-Length") or 0)
+                encoded = dr.headers.get("Content-Encoding", "identity") != "identity"
+                dr.raw.decode_content = encoded
+                # Content-Length is the encoded size, so only trust it for identity bodies
+                with open(temp_path, "wb") as f:
+                    _fadvise(f.fileno(), "POSIX_FADV_SEQUENTIAL")
+                    if size > 0 and not encoded:
+                        _preallocate(f, size)
+                    out = _GatherWriter(f)
+                    shutil.copyfileobj(_CancellableStream(dr.raw, self), out, self.chunk_size)
+                    out.flush()
+                    # Drop any reserved tail if the body came up short
+                    f.truncate(f.tell())
+            if self._cancelled:
+                logger.info("Download cancelled")
+                return None
+            # The file is only renamed from here on, never read back
+            _release_pages(temp_path)
             
             if out_path.exists():
                 logger.info(f"Removing existing file: {out_path}")
@@ -119,6 +343,10 @@ class Worker(QObject):
 
     def run(self) -> None:
         """Main worker loop"""
+        if self._cancelled:
+            # Cancelled while still waiting for a pool thread
+            return
+        import requests
         try:
             headers = {"Authorization": f"Bearer {self.api_key}"}
             
@@ -161,13 +389,24 @@ class Worker(QObject):
                         "size": self.size
                     }
                     self.logged.emit("Submitting job (multipart)...")
-                    r = requests.post(
-                        f"{API_BASE}/videos", 
-                        headers=headers, 
-                        files=files, 
-                        data=data, 
-                        timeout=TIMEOUT_POST
-                    )
+                    encoder = _multipart_encoder()
+                    if encoder:
+                        # Streams the reference file instead of building the whole body in memory
+                        m = encoder(fields={**data, **files})
+                        r = self.session.post(
+                            f"{API_BASE}/videos", 
+                            headers={**headers, "Content-Type": m.content_type}, 
+                            data=m, 
+                            timeout=TIMEOUT_POST
+                        )
+                    else:
+                        r = self.session.post(
+                            f"{API_BASE}/videos", 
+                            headers=headers, 
+                            files=files, 
+                            data=data, 
+                            timeout=TIMEOUT_POST
+                        )
                     body = self.record(r, "POST /videos")
             else:
                 payload = {
@@ -177,9 +416,9 @@ class Worker(QObject):
                     "size": self.size
                 }
                 self.logged.emit("Submitting job (json)...")
-                r = requests.post(
+                r = self.session.post(
                     f"{API_BASE}/videos", 
-                    headers={**headers, "Content-Type": "application/json"}, 
+                    headers=headers, 
                     json=payload, 
                     timeout=TIMEOUT_POST
                 )
@@ -207,41 +446,72 @@ class Worker(QObject):
     
     def _poll_until_complete(self, headers: Dict[str, str]) -> None:
         """Poll job status until completion or timeout"""
-        start = time.time()
+        import requests
+        deadline = time.monotonic() + self.max_minutes * 60
         backoff = max(1, self.poll_every)
         last_status = None
         last_prog = -1
         stuck_99 = 0
+        # EWMA of progress percent per second, used to space out polls mid-job
+        rate: Optional[float] = None
+        rate_sample: Optional[Tuple[float, int]] = None
+        # Validator and body of the last 200, for conditional polls
+        etag: Optional[str] = None
+        last_body: Optional[Dict[str, Any]] = None
+        poll_headers = headers
         
-        while not self._cancelled:
-            if time.time() - start > self.max_minutes * 60:
+        while not self._cancel_event.is_set():
+            if time.monotonic() > deadline:
                 ids = ", ".join(self.req_ids) if self.req_ids else "none"
                 self.failed.emit(f"Timed out after {self.max_minutes} minutes. Last request IDs: {ids}")
                 return
             
             try:
-                pr = requests.get(
+                pr = self.session.get(
                     f"{API_BASE}/videos/{self.job_id}", 
-                    headers=headers, 
+                    headers=poll_headers, 
                     timeout=TIMEOUT_GET
                 )
             except requests.exceptions.RequestException as e:
                 logger.warning(f"Poll request failed: {e}")
                 self.logged.emit(f"Polling error: {str(e)}")
-                time.sleep(backoff)
-                backoff = min(MAX_BACKOFF, backoff + 1)
+                # Full jitter keeps many workers from retrying in lockstep
+                if self._sleep(random.uniform(0, backoff)):
+                    return
+                backoff = min(MAX_BACKOFF, backoff * BACKOFF_MULTIPLIER)
                 continue
             
-            body = self.record(pr, f"GET /videos/{self.job_id}")
+            unchanged = pr.status_code == 304 and last_body is not None
+            if unchanged:
+                # Nothing new since the last poll; skip parsing and reporting
+                body = last_body
+            else:
+                body = self.record(pr, f"GET /videos/{self.job_id}")
+            
+            if pr.status_code == 429:
+                retry_after = self._retry_after(pr)
+                delay = retry_after if retry_after is not None else random.uniform(0, backoff)
+                self.logged.emit(f"Rate limited, retrying in {delay:.0f}s...")
+                if self._sleep(delay):
+                    return
+                backoff = min(MAX_BACKOFF, backoff * BACKOFF_MULTIPLIER)
+                continue
             
             if pr.status_code >= 500:
                 self.logged.emit(f"Server error {pr.status_code}, retrying...")
                 logger.warning(f"Server error {pr.status_code}: {pretty(body)}")
-                time.sleep(backoff + random.uniform(0, 0.5))
+                if self._sleep(random.uniform(0, backoff)):
+                    return
                 backoff = min(MAX_BACKOFF, backoff * BACKOFF_MULTIPLIER)
                 continue
             
-            if pr.status_code != 200:
+            if pr.status_code == 200:
+                new_etag = pr.headers.get("ETag")
+                if new_etag != etag:
+                    etag = new_etag
+                    poll_headers = {**headers, "If-None-Match": etag} if etag else headers
+                last_body = body
+            elif not unchanged:
                 error_msg = self._parse_error(pr.status_code, body)
                 self.failed.emit(error_msg)
                 return
@@ -249,6 +519,12 @@ class Worker(QObject):
             status = body.get("status", "")
             prog = int(body.get("progress", 0) or 0)
             
+            now = time.monotonic()
+            if rate_sample is not None and now > rate_sample[0]:
+                new_rate = max(0, prog - rate_sample[1]) / (now - rate_sample[0])
+                rate = new_rate if rate is None else POLL_RATE_ALPHA * new_rate + (1 - POLL_RATE_ALPHA) * rate
+            rate_sample = (now, prog)
+            
             if status != last_status or prog != last_prog:
                 self.logged.emit(f"Status: {status} {prog}%")
                 self.progressed.emit(prog)
@@ -268,7 +544,13 @@ class Worker(QObject):
             else:
                 stuck_99 = 0
             
-            time.sleep(max(1, self.poll_every))
+            # A good poll resets the error backoff; jitter the normal cadence too
+            interval = backoff = max(1, self.poll_every)
+            if rate and prog < 99:
+                # Aim for ~4 polls over the estimated remaining time
+                interval = max(interval, min((100 - prog) / rate / 4, MAX_POLL_INTERVAL))
+            if self._sleep(random.uniform(interval * 0.5, interval * 1.5)):
+                return
     
     def _parse_error(self, status_code: int, body: Dict[str, Any]) -> str:
         """Parse API error response into user-friendly message"""
@@ -281,3 +563,19 @@ class Worker(QObject):
             return f"Request error: {error_msg}"
         else:
             return f"Error {status_code}:\n{pretty(body)}"
+
+
+class ShotRunnable(QRunnable):
+    """Runs a Worker on a QThreadPool thread; `done` is set when it returns"""
+
+    def __init__(self, worker: Worker):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.worker = worker
+        self.done = threading.Event()
+
+    def run(self) -> None:
+        try:
+            self.worker.run()
+        finally:
+            self.done.set()
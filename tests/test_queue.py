@@ -0,0 +1,27 @@
+import unittest
+
+from sora_core.models import Shot
+from sora_core.queue import QueueManager
+
+
+def _shot(shot_id: str) -> Shot:
+    return Shot(id=shot_id, model="sora-2", width=1280, height=720, duration_s=4, prompt="test")
+
+
+class StatusListenerTests(unittest.TestCase):
+    def test_every_listener_sees_each_transition(self):
+        qm = QueueManager()
+        first, second = [], []
+        qm.add_status_listener(lambda shot_id, status: first.append((shot_id, status)))
+        qm.add_status_listener(lambda shot_id, status: second.append((shot_id, status)))
+
+        qm.enqueue(_shot("a"))
+        qm.cancel("a")
+
+        expected = [("a", "queued"), ("a", "cancelled")]
+        self.assertEqual(first, expected)
+        self.assertEqual(second, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()